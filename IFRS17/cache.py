@@ -0,0 +1,134 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+import pandas as pd
+
+from IFRS17.engine import ENGINE_VERSION, GMMEngine
+from IFRS17.io import reduce_assumptions
+
+
+def normalize_assumptions(assumptions):
+    # Row order, unused columns and the split of rows within a key do not
+    # change the results
+    return reduce_assumptions(assumptions).reset_index()
+
+
+def run_key(assumptions,
+            parameters,
+            mapping=None,
+            coverage_units=None,
+            by_cohort=False):
+    """Content hash of a run.
+
+    Covers the normalized assumptions, the parameters table, the mapping
+    table, any coverage units table, ``by_cohort`` and ``ENGINE_VERSION``.
+    """
+    digest = hashlib.blake2b(str(ENGINE_VERSION).encode(), digest_size=20)
+    if by_cohort:
+        digest.update(b'by_cohort')
+    frames = [normalize_assumptions(assumptions), parameters, mapping]
+    if coverage_units is not None:
+        frames.append(coverage_units)
+    for frame in frames:
+        if frame is None:
+            digest.update(b'None')
+            continue
+        rows = pd.util.hash_pandas_object(frame, index=False)
+        digest.update(repr(list(frame.columns)).encode())
+        digest.update(rows.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """On-disk cache of the six reports of ``GMMEngine`` runs.
+
+    Every run is stored as one pickle named after its ``run_key``. Reading
+    an entry marks it as recently used and, once the entries take more
+    than ``max_bytes``, the least recently used ones are removed.
+
+    ``run`` counts its ``hits`` and ``misses``. Given the engine of an
+    earlier run as ``previous``, a miss only evaluates the groups that
+    changed since that run, see ``GMMEngine.update``.
+    """
+
+    def __init__(self, directory, max_bytes=1 << 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def run(self,
+            assumptions,
+            parameters,
+            mapping=None,
+            workers=1,
+            previous=None,
+            coverage_units=None,
+            by_cohort=False):
+        # The engine is built from exactly the arguments in the key, a
+        # previous run only supplies the groups that did not change
+        key = run_key(assumptions, parameters, mapping, coverage_units,
+                      by_cohort)
+        engine = GMMEngine(assumptions,
+                           parameters,
+                           mapping=mapping,
+                           workers=workers,
+                           by_cohort=by_cohort,
+                           coverage_units=coverage_units,
+                           previous=previous)
+
+        reports = self.get(key)
+        if reports is None:
+            self.misses += 1
+            self.put(key, engine.reports())
+        else:
+            self.hits += 1
+            # Stored reports take the place of the lazily evaluated ones
+            for name, frame in reports.items():
+                setattr(engine, name, frame)
+        return engine
+
+    def get(self, key):
+        # A missing, evicted or damaged entry is a miss
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                reports = pickle.load(file)
+            os.utime(path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        return reports
+
+    def put(self, key, reports):
+        # Written under a temporary name of its own so that readers and
+        # concurrent writers never see partial files
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory,
+                                                 suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(reports, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.remove(temporary)
+            raise
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.pkl'):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, name in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.directory, name))
+            size -= entry_size
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pkl')
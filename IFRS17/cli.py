@@ -0,0 +1,143 @@
+"""
+Run the General Measurement Model on an assumption file and write its
+reports, for scheduled batch runs
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+from IFRS17.cache import ResultCache
+from IFRS17.cube import GROUP
+from IFRS17.engine import GMMEngine
+from IFRS17.io import read_assumptions, read_assumptions_parquet
+from IFRS17.sinks import CSVSink, ParquetSink, REPORT_NAMES, write_reports
+from IFRS17.store import write_store
+
+FORMATS = ['csv', 'parquet', 'store']
+
+
+def parser():
+    parser = argparse.ArgumentParser(prog='python -m IFRS17.cli',
+                                     description=__doc__)
+    parser.add_argument('assumptions',
+                        help="assumption CSV, Parquet file or Parquet "
+                        "dataset directory")
+    parser.add_argument('parameters', help="parameters CSV")
+    parser.add_argument('-o', '--output', default='.',
+                        help="directory the reports are written to")
+    parser.add_argument('-f', '--format', choices=FORMATS, default='csv',
+                        help="report format (default: %(default)s)")
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help="worker processes (default: %(default)s)")
+    parser.add_argument('-g', '--group', nargs=2, action='append',
+                        metavar=('PRODUCT', 'SUB_PRODUCT'),
+                        help="only run this Product/Sub-Product, can be "
+                        "repeated")
+    parser.add_argument('--coverage-units', metavar='FILE',
+                        help="CSV of coverage units by group and Period to "
+                        "release the CSM by")
+    parser.add_argument('--cache', metavar='DIRECTORY',
+                        help="reuse and keep results in this cache")
+    parser.add_argument('--previous', metavar='ASSUMPTIONS',
+                        help="assumptions of an earlier cached run, only "
+                        "groups changed since then are evaluated")
+    parser.add_argument('--timings', action='store_true',
+                        help="also write the stage timings to timings.csv")
+    return parser
+
+
+def read(path, groups=None):
+    if os.path.isdir(path) or path.endswith('.parquet'):
+        return read_assumptions_parquet(path, groups)
+
+    assumptions = read_assumptions(path)
+    if groups:
+        rows = pd.MultiIndex.from_frame(assumptions[GROUP]).isin(
+            [tuple(group) for group in groups])
+        assumptions = assumptions.loc[rows]
+    return assumptions
+
+
+def write(engine, output, format):
+    if format == 'store':
+        write_store(os.path.join(output, 'results.ifrs17'), engine.reports())
+    else:
+        sink = CSVSink(output) if format == 'csv' else ParquetSink(output)
+        write_reports(engine.reports(), sink)
+
+
+def run(args):
+    started = time.perf_counter()
+    parameters = pd.read_csv(args.parameters)
+    assumptions = read(args.assumptions, args.group)
+    if len(assumptions.index) == 0:
+        raise ValueError("No assumptions to run" +
+                         (" for the selected groups" if args.group else ""))
+
+    coverage_units = None
+    if args.coverage_units is not None:
+        coverage_units = pd.read_csv(args.coverage_units)
+
+    cache = None if args.cache is None else ResultCache(args.cache)
+    if cache is None:
+        engine = GMMEngine(assumptions,
+                           parameters,
+                           workers=args.workers,
+                           coverage_units=coverage_units)
+    else:
+        previous = None
+        if args.previous is not None:
+            previous = cache.run(read(args.previous, args.group),
+                                 parameters,
+                                 workers=args.workers,
+                                 coverage_units=coverage_units)
+        engine = cache.run(assumptions,
+                           parameters,
+                           workers=args.workers,
+                           previous=previous,
+                           coverage_units=coverage_units)
+
+    os.makedirs(args.output, exist_ok=True)
+    write(engine, args.output, args.format)
+    if args.timings:
+        engine.Timings.to_csv(os.path.join(args.output, 'timings.csv'),
+                              index=False)
+
+    summary = [
+        "Assumptions: %d rows, %d groups" %
+        (len(assumptions.index), len(engine.cube.groups)),
+        "Reports: %s written to %s as %s" %
+        (", ".join(REPORT_NAMES), args.output, args.format),
+    ]
+    if cache is not None:
+        summary.append("Cache: %d hits, %d misses" %
+                       (cache.hits, cache.misses))
+    summary.append("Elapsed: %.1fs" % (time.perf_counter() - started))
+    return summary
+
+
+def main(argv=None):
+    """Entry point, returns the process exit code: 0 on success, 1 when the
+    run fails and 2 for invalid arguments."""
+    args = parser().parse_args(argv)
+    if args.previous is not None and args.cache is None:
+        parser().error("--previous needs --cache")
+    if args.workers < 1:
+        parser().error("--workers must be at least 1")
+
+    try:
+        summary = run(args)
+    except Exception as error:
+        print("IFRS17 run failed: %s: %s" % (type(error).__name__, error),
+              file=sys.stderr)
+        return 1
+
+    print("\n".join(summary))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+import copy
+
+import pandas as pd
+import numpy as np
+
+
+KEYS = ['MAP%03d' % i for i in range(20)]
+
+MEASURES = [
+    'Gross_BE', 'Gross_LossC_BE', 'Gross_RA', 'Gross_LossC_RA', 'Gross_CSM',
+    'Gross_BECFPV', 'Gross_RACFPV', 'Gross_Actual'
+]
+
+GROUP = ['Product', 'Sub-Product']
+
+BUSINESS_TYPES = ['NB', 'IF']
+
+# Grain at which the assumptions are read, sub-annual runs add a Period
+# column
+INPUT_KEYS = ['Cohort'] + GROUP + ['BusinessType', 'Key']
+
+
+def input_keys(columns):
+    return INPUT_KEYS + [column for column in ['Period'] if column in columns]
+
+
+class EncodedAssumptions:
+    """Assumption table with its labels replaced by small integer codes.
+
+    The ``labels`` columns, Product/Sub-Product by default, become
+    positions in ``groups`` (int32), Cohort an
+    int16 offset from ``cohort_base`` and the period a position in
+    ``periods`` (int16). Key becomes its position in ``KEYS`` and
+    BusinessType its position in ``BUSINESS_TYPES`` (int8, -1 for any other
+    key or business type). The measures are held in one contiguous float64
+    block, with missing values read as 0.
+
+    The periods are read from the Period column when there is one, at the
+    sub-annual pandas ``frequency`` if given, and are the Cohort years
+    otherwise. Rows missing a group, Cohort, Key or Period label are
+    dropped.
+    """
+
+    def __init__(self, assumptions, frequency=None, labels=GROUP):
+        required = list(labels) + ['Cohort', 'Key']
+        if 'Period' in assumptions.columns:
+            required.append('Period')
+        elif frequency is not None:
+            raise ValueError("A sub-annual Reporting Frequency needs a "
+                             "Period column in the assumptions")
+        elif 'Cohort' in labels:
+            # Otherwise every cohort would only have values in its own year
+            raise ValueError("Cohort groups need a Period column in the "
+                             "assumptions")
+        labelled = assumptions[required].notna().all(axis=1).to_numpy()
+        frame = assumptions.loc[labelled]
+
+        # Groups are numbered in sorted order, like a groupby, from the
+        # mixed-radix combination of the codes of every label
+        combined = np.zeros(len(frame.index), dtype=np.int64)
+        levels = []
+        for label in labels:
+            codes, names = pd.factorize(frame[label], sort=True)
+            combined = combined * len(names) + codes
+            levels.append(names)
+        combinations, group = np.unique(combined, return_inverse=True)
+
+        arrays = []
+        for names in reversed(levels):
+            arrays.insert(0, names[combinations % len(names)])
+            combinations = combinations // len(names)
+        self.groups = pd.MultiIndex.from_arrays(arrays, names=list(labels))
+        self.group = group.astype(np.int32)
+
+        cohort = frame['Cohort'].to_numpy(dtype=np.int64)
+        self.cohort_base = cohort.min() if len(cohort) > 0 else 0
+        self.cohort = (cohort - self.cohort_base).astype(np.int16)
+
+        if 'Period' not in frame.columns:
+            # Yearly periods are the Cohort years, numbered from the offsets
+            period, offsets = pd.factorize(self.cohort, sort=True)
+            self.periods = pd.Index(
+                offsets.astype(np.int64) + self.cohort_base)
+        else:
+            if frequency is None:
+                periods = pd.to_numeric(
+                    frame['Period']).to_numpy(dtype=np.int64)
+            else:
+                periods = pd.PeriodIndex(frame['Period'].astype(str),
+                                         freq=frequency)
+            period, self.periods = pd.factorize(periods, sort=True)
+        self.period = period.astype(np.int16)
+
+        self.key = pd.Categorical(frame['Key'], categories=KEYS).codes
+        self.business_type = pd.Categorical(frame['BusinessType'],
+                                            categories=BUSINESS_TYPES).codes
+
+        self.measures = np.array(frame[MEASURES], dtype=float, order='C')
+        self.measures[np.isnan(self.measures)] = 0
+
+
+class AssumptionCube:
+    """Dense (group x period x key x measure) view of an assumption table.
+
+    The assumptions are encoded once with ``EncodedAssumptions`` and summed
+    at the finest grain of Product/Sub-Product, period, BusinessType and
+    Key into a zero-filled NumPy array, so that a missing row reads as 0
+    exactly like ``iferror`` in ``GMM``. The view over all business types is
+    the sum over the BusinessType axis and ``business_type`` selects a
+    single one. Passing ``groups`` lays the cube out on an existing group
+    index, ``labels`` are the columns identifying a group.
+    """
+
+    def __init__(self, assumptions, periods, groups=None, labels=GROUP):
+        self.periods = pd.Index(periods, name='Period')
+
+        if not isinstance(assumptions, EncodedAssumptions):
+            assumptions = EncodedAssumptions(
+                assumptions, getattr(self.periods, 'freq', None), labels)
+        self.groups = assumptions.groups if groups is None else groups
+
+        g = self.groups.get_indexer(assumptions.groups)[assumptions.group]
+        p = self.periods.get_indexer(
+            assumptions.periods)[assumptions.period]
+        k = assumptions.key
+        keep = (g >= 0) & (p >= 0) & (k >= 0)
+
+        # Business types other than NB and IF share the last slot, they only
+        # count towards the view over all business types
+        t = assumptions.business_type.astype(np.int64)
+        t[t < 0] = len(BUSINESS_TYPES)
+
+        shape = (len(self.groups), len(self.periods), len(BUSINESS_TYPES) + 1,
+                 len(KEYS))
+        cell = np.ravel_multi_index((g[keep], p[keep], t[keep], k[keep]),
+                                    shape)
+        measures = assumptions.measures[keep]
+
+        self.by_type = np.empty(shape + (len(MEASURES), ))
+        for m in range(len(MEASURES)):
+            self.by_type[..., m] = np.bincount(
+                cell, weights=measures[:, m],
+                minlength=int(np.prod(shape))).reshape(shape)
+        self.values = self.by_type.sum(axis=2)
+
+    def business_type(self, business_type):
+        cube = copy.copy(self)
+        cube.values = self.by_type[:, :, BUSINESS_TYPES.index(business_type)]
+        return cube
+
+    def __getitem__(self, item):
+        key, measure = item
+        return self.values[:, :, KEYS.index(key), MEASURES.index(measure)]
+
+
+def stack_cubes(cubes, keys, name='Scenario'):
+    """Stack cubes laid out on the same groups and periods into one cube
+    whose groups gain a leading ``name`` level taking the ``keys``."""
+    cube = copy.copy(cubes[0])
+    cube.groups = pd.MultiIndex.from_tuples(
+        [(key, ) + group for key in keys for group in cubes[0].groups],
+        names=[name] + list(cubes[0].groups.names))
+    cube.by_type = np.concatenate([c.by_type for c in cubes])
+    cube.values = cube.by_type.sum(axis=2)
+    return cube
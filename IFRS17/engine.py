@@ -0,0 +1,733 @@
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from functools import cached_property, partial, wraps
+import hashlib
+
+from IFRS17.cube import AssumptionCube, BUSINESS_TYPES, GROUP, KEYS, MEASURES
+from IFRS17.kernels import amortise, roll_forward
+from IFRS17.mapping import CompiledMapping, DEFAULT_MAPPING
+from IFRS17.parallel import CHUNKS_PER_WORKER, group_chunks, map_chunks
+from IFRS17.profiling import StageTimer
+from IFRS17.reports import (AMC_REPORTS, ARC_REPORTS, MEASURE_ABRC,
+                            analysis_by_measurement_component,
+                            analysis_by_remaining_coverage)
+from IFRS17.sinks import REPORT_NAMES, write_reports
+
+# Part of the key of cached runs, to be raised whenever results change
+ENGINE_VERSION = 2
+
+RECONCILIATION_COLUMNS = [
+    "Opening Balance", "Changes Related to Future Service: New Business",
+    "Changes Related to Future Service: Assumptions",
+    "Insurance Service Expense",
+    "Changes Related to Current Service: Experience",
+    "Changes Related to Current Service: Release",
+    "Changes Related to Past Service", "Closing Balance"
+]
+
+INITIAL_RECOGNITION_COLUMNS = [
+    "PV Premium", "PV Claims", "PV Risk Adjustment", "PV Acquisition Expense",
+    "CSM at Initial Recognition", "LIABILITY ON INITIAL RECOGNITION-BE",
+    "LIABILITY ON INITIAL RECOGNITION-RA"
+]
+
+# Reports of a GMMEngine
+REPORTS = ['Liability_on_Initial_Recognition'] + list(REPORT_NAMES)
+
+# Reports rolled forward together, a chunk of a parallel run evaluating one
+# of them returns all three
+RECONCILIATIONS = ['BEL', 'RA', 'CSM']
+
+# Pandas frequency of each Reporting Frequency, yearly periods are plain
+# years matching the Cohort column
+FREQUENCIES = {'Yearly': None, 'Quarterly': 'Q', 'Monthly': 'M'}
+
+COVERAGE_UNITS = ['Input', 'Derived']
+
+# Assumption cell holding the CSM release, replaced by the release by
+# coverage units when there are any
+RELEASE_CELL = ('MAP014', 'Gross_CSM')
+
+
+def read_parameters(parameters):
+    """Read the run settings from a ``Parameters.csv`` style table.
+
+    Rows are looked up by their label in the first column. Tables without
+    labels fall back to the row positions used by ``GMM``.
+    """
+    labels = parameters.iloc[:, 0].astype(str).str.strip()
+    selection = parameters["Selection"]
+
+    def lookup(label, position=None):
+        match = selection[labels == label]
+        if len(match.index) > 0:
+            return match.iloc[0]
+        if position is None:
+            return None
+        return selection.iloc[position]
+
+    def date(value):
+        return datetime.strptime(value, '%d/%m/%Y')
+
+    start = date(lookup("Start of Reporting Period", 0))
+    end = date(lookup("End of Reporting Period", 1))
+    inception = lookup("Year of inception")
+    inception = start if inception is None else date(inception)
+
+    frequency = str(lookup("Reporting Frequency") or 'Yearly').strip()
+    if frequency not in FREQUENCIES:
+        raise ValueError("Unknown Reporting Frequency: " + frequency)
+
+    coverage_units = str(lookup("Coverage units") or 'Input').strip()
+    if coverage_units not in COVERAGE_UNITS:
+        raise ValueError("Unknown Coverage units: " + coverage_units)
+
+    return {
+        'start': start.year,
+        'end': end.year,
+        'inception': inception.year,
+        'csm_mode': lookup("CSM Mode", 2),
+        'frequency': FREQUENCIES[frequency],
+        'coverage_units': coverage_units,
+        'start_date': start,
+        'end_date': end,
+        'inception_date': inception,
+    }
+
+
+def reporting_periods(settings):
+    # Period axis of a run, years or pandas periods of a sub-annual frequency
+    if settings['frequency'] is None:
+        return pd.Index(range(settings['start'], settings['end'] + 1),
+                        name='Period')
+    return pd.period_range(settings['start_date'],
+                           settings['end_date'],
+                           freq=settings['frequency'],
+                           name='Period')
+
+
+def report(evaluate):
+    """A report of ``GMMEngine``, evaluated on first access and kept.
+
+    Reports are built from the groups of an earlier run where an update
+    allows it, and from the process pool when running with workers.
+    """
+
+    @wraps(evaluate)
+    def wrapper(self):
+        with self.timer.stage(evaluate.__name__) as counted:
+            if self._previous is not None:
+                result = self._merge_groups(evaluate.__name__)
+            elif self._chunks:
+                result = self._merge_chunks(evaluate.__name__)
+            else:
+                result = evaluate(self)
+            counted['rows'] = len(result.index)
+        self.timer.size(evaluate.__name__, result)
+        return result
+
+    return cached_property(wrapper)
+
+
+def stage(evaluate):
+    """An intermediate result of ``GMMEngine``, timed on first access and
+    kept."""
+
+    @wraps(evaluate)
+    def wrapper(self):
+        with self.timer.stage(evaluate.__name__):
+            result = evaluate(self)
+        self.timer.size(evaluate.__name__, result)
+        return result
+
+    return cached_property(wrapper)
+
+
+class GMMEngine:
+    """Array-backed General Measurement Model.
+
+    Produces the same reconciliations as ``GMM`` but pivots the assumptions
+    once into an ``AssumptionCube`` and evaluates every Product/Sub-Product
+    group and period with whole-array operations. With ``workers`` above 1
+    the groups are split into chunks of similar row counts and evaluated on
+    a pool of that many processes.
+
+    Nothing is calculated up front. Each report (``BEL``, ``RA``, ``CSM``,
+    ``TCL``, ``AMC``, ``ARC``) is evaluated on first access together with
+    the intermediate results it needs and kept for later accesses, so
+    asking for ``TCL`` never builds the remaining coverage analysis. With
+    workers, the chunks only evaluate the report asked for and the reports
+    it depends on. ``reports`` evaluates several reports at once, in a
+    single pass of the pool. Passing a ``sink`` evaluates and writes every
+    report, see ``IFRS17.sinks``.
+
+    With ``by_cohort`` every annual Cohort of a Product/Sub-Product is a
+    group of contracts of its own: the reports gain a Cohort column, each
+    cohort is initially recognised in its own year and ``rollup`` sums the
+    reports back to product level. The assumptions then need a Period
+    column, as the Cohort column no longer gives the period.
+
+    The CSM is released by coverage units when ``coverage_units`` is given
+    or the "Coverage units" parameter is ``Derived``, see
+    ``_coverage_fractions``. Otherwise the release is read from MAP014.
+
+    Passing the engine of an earlier run as ``previous`` reuses its reports
+    for the groups whose assumptions, coverage units, parameters and mapping
+    are unchanged, see ``update``.
+
+    ``Timings`` gives the wall and CPU seconds of every report and
+    intermediate result evaluated so far. With ``profile_memory`` it also
+    gives their peak and retained allocations, and ``Frame_Sizes`` the size
+    of each result. With workers, the stages each chunk ran in its process
+    follow, numbered in ``Chunk``.
+    """
+
+    def __init__(self,
+                 assumptions,
+                 parameters,
+                 mapping=None,
+                 workers=1,
+                 sink=None,
+                 by_cohort=False,
+                 profile_memory=False,
+                 coverage_units=None,
+                 previous=None):
+        if previous is not None and previous.by_cohort != by_cohort:
+            raise ValueError("An incremental run needs the same by_cohort "
+                             "setting as the previous run")
+        self.Assumptions = assumptions
+        self.Parameters = parameters
+        self.Coverage_Units = coverage_units
+        self.settings = read_parameters(parameters)
+        self.workers = workers
+        self.by_cohort = by_cohort
+
+        self._mapping = mapping
+        self.mapping = CompiledMapping(
+            DEFAULT_MAPPING if mapping is None else mapping)
+        self._previous = previous
+        self.timer = StageTimer(memory=profile_memory)
+
+        self.write(sink)
+
+    def write(self, sink):
+        if sink is not None:
+            write_reports(self.reports(), sink)
+
+    def reports(self, names=REPORT_NAMES):
+        # The reports by name, those still to evaluate in the chunks of a
+        # parallel run are evaluated in one pass of the pool
+        if self._previous is not None:
+            if len(self._dirty) > 0:
+                self._dirty_engine.reports(names)
+        elif self._chunks:
+            self._evaluate_chunks(names)
+        return {name: getattr(self, name) for name in names}
+
+    @property
+    def Timings(self):
+        return self.timer.report()
+
+    @property
+    def Frame_Sizes(self):
+        return self.timer.frame_sizes()
+
+    def update(self, assumptions, parameters=None):
+        """Engine for corrected assumptions (and optionally parameters).
+
+        Groups whose aggregated assumptions and parameters are unchanged
+        take their rows from this engine's reports, only the other groups
+        are evaluated again.
+        """
+        engine = GMMEngine(assumptions,
+                           self.Parameters if parameters is None else
+                           parameters,
+                           mapping=self._mapping,
+                           workers=self.workers,
+                           by_cohort=self.by_cohort,
+                           profile_memory=self.timer.memory,
+                           coverage_units=self.Coverage_Units,
+                           previous=self)
+        return engine
+
+    def rollup(self, report, levels=None):
+        """Sum a report over the group levels not in ``levels``, by default
+        from groups of contracts up to every level but Cohort.
+
+        This is not the report of a run without cohorts: each cohort is
+        initially recognised, and tested for onerousness, on its own.
+        """
+        frame = getattr(self, report)
+        names = list(self.cube.groups.names)
+        if levels is None:
+            levels = [name for name in names if name != 'Cohort']
+        dropped = [name for name in names if name not in levels]
+
+        if report == 'Liability_on_Initial_Recognition':
+            return frame.groupby(level=levels, sort=False).sum()
+
+        indexed = 'Period' not in frame.columns
+        frame = frame.reset_index() if indexed else frame
+        keys = [column for column in frame.columns
+                if column in levels + ['Period', 'Measure']]
+        rolled = frame.drop(columns=dropped).groupby(keys, sort=False).sum()
+        rolled = rolled.reset_index()[[
+            column for column in frame.columns if column not in dropped
+        ]]
+        return rolled.set_index('Period') if indexed else rolled
+
+    # Reports are evaluated on first access and kept, each one pulls in only
+    # the intermediate results it depends on
+
+    @report
+    def Liability_on_Initial_Recognition(self):
+        return self._initial_recognition(self.cube)
+
+    @report
+    def BEL(self):
+        return self._reconciliations['BEL']
+
+    @report
+    def RA(self):
+        return self._reconciliations['RA']
+
+    @report
+    def CSM(self):
+        return self._reconciliations['CSM']
+
+    @report
+    def TCL(self):
+        reconciliations = [self.BEL, self.RA, self.CSM]
+        labels = list(self.cube.groups.names)
+        tcl = self.BEL[labels].copy()
+        for frame in reconciliations:
+            for column in frame.columns.drop(labels):
+                if column not in tcl.columns:
+                    tcl[column] = sum(other[column].to_numpy()
+                                      for other in reconciliations
+                                      if column in other.columns)
+        tcl["Closing Balance"] = tcl.pop("Closing Balance")
+        return tcl
+
+    @report
+    def AMC(self):
+        new_business = "Changes Related to Future Service: New Business"
+        return analysis_by_measurement_component(
+            self.cube.groups, self.cube.periods, {
+                measure: self.mapping.report(report, self.mapped)
+                for measure, report in AMC_REPORTS.items()
+            }, {
+                measure: self._movements[name][new_business]
+                for measure, name in zip(AMC_REPORTS, self._movements)
+            })
+
+    @report
+    def ARC(self):
+        # NB and IF business are kept apart
+        lir = self._initial_recognition(self.cube_by_type['NB'])
+        return analysis_by_remaining_coverage(
+            self.cube.groups, self.cube.periods, {
+                measure: self.mapping.report(
+                    report, self.mapped_by_type[business_type])
+                for measure, (report, business_type) in ARC_REPORTS.items()
+            }, {
+                MEASURE_ABRC[0]:
+                self._at_inception(
+                    -lir[["CSM at Initial Recognition"]].to_numpy()),
+                MEASURE_ABRC[1]:
+                self._at_inception(lir[[
+                    "LIABILITY ON INITIAL RECOGNITION-BE",
+                    "LIABILITY ON INITIAL RECOGNITION-RA"
+                ]].sum(axis=1).to_numpy()[:, None]),
+            })
+
+    # Intermediate results
+
+    @stage
+    def cube(self):
+        labels = GROUP + ['Cohort'] if self.by_cohort else GROUP
+        return AssumptionCube(self.Assumptions,
+                              reporting_periods(self.settings),
+                              labels=labels)
+
+    @stage
+    def cube_by_type(self):
+        return {
+            business_type: self.cube.business_type(business_type)
+            for business_type in BUSINESS_TYPES
+        }
+
+    @stage
+    def mapped(self):
+        if self._csm_release is None:
+            return self._unreleased
+        return self._release(self._unreleased, self.cube, self._csm_release)
+
+    @stage
+    def _unreleased(self):
+        # Every mapped movement line for all groups and periods at once,
+        # with the CSM release as read from the assumptions
+        return self.mapping.apply(self.cube.values)
+
+    @stage
+    def mapped_by_type(self):
+        # A CSM release by coverage units is new business, groups without
+        # coverage units keep the MAP014 release of each business type
+        if self._csm_release is None:
+            return self._unreleased_by_type
+        released = np.isfinite(self._coverage_fractions)
+        mapped = {}
+        for business_type, cube in self.cube_by_type.items():
+            cell = self._csm_release if business_type == 'NB' else 0
+            mapped[business_type] = self._release(
+                self._unreleased_by_type[business_type], cube,
+                np.where(released, cell, cube[RELEASE_CELL]))
+        return mapped
+
+    @stage
+    def _unreleased_by_type(self):
+        return {
+            business_type: self.mapping.apply(cube.values)
+            for business_type, cube in self.cube_by_type.items()
+        }
+
+    @stage
+    def _coverage_fractions(self):
+        """Share of the CSM released in each (group x period), None when
+        the release is read from MAP014.
+
+        The share is the coverage units provided in the period over those
+        provided in it and expected in later periods. ``coverage_units``
+        gives them as a table of group columns, Period and Coverage Units
+        whose periods may run past the end of the run. Derived coverage
+        units are the expected claims released, MAP013 Gross_BE, within the
+        run. Groups without coverage units are NaN and keep the MAP014
+        release.
+        """
+        if self.Coverage_Units is not None:
+            table = self.Coverage_Units
+            if self.settings['frequency'] is None:
+                periods = pd.to_numeric(table['Period'])
+            else:
+                periods = pd.PeriodIndex(table['Period'].astype(str),
+                                         freq=self.settings['frequency'])
+            units = table.assign(Period=periods).pivot_table(
+                index=list(self.cube.groups.names),
+                columns='Period',
+                values='Coverage Units',
+                aggfunc='sum',
+                fill_value=0).sort_index(axis=1)
+            units = units.reindex(self.cube.groups)
+        elif self.settings['coverage_units'] == 'Derived':
+            units = pd.DataFrame(np.abs(self.cube['MAP013', 'Gross_BE']),
+                                 columns=self.cube.periods)
+        else:
+            return None
+
+        # Units provided in each period and all later ones
+        later = units.iloc[:, ::-1].cumsum(axis=1).iloc[:, ::-1]
+        fractions = (units / later.where(later > 0)).fillna(0).reindex(
+            columns=self.cube.periods, fill_value=0).to_numpy()
+        fractions[~(units.sum(axis=1) > 0).to_numpy()] = np.nan
+        return fractions
+
+    @stage
+    def _csm_release(self):
+        # Value of the release cell that releases the CSM by coverage
+        # units, from the CSM before release: the opening balance, new
+        # business and every other CSM movement
+        fractions = self._coverage_fractions
+        if fractions is None:
+            return None
+
+        column = self._release_column
+        csm = [i for i, (name, _) in enumerate(self.mapping.lines)
+               if name == 'CSM']
+        weight = self.mapping.matrix[csm, column].sum()
+        if weight == 0:
+            raise ValueError("The mapping has no CSM line reading " +
+                             " ".join(RELEASE_CELL))
+
+        cell = self.cube[RELEASE_CELL]
+        change = (self._unreleased[..., csm].sum(axis=-1) - weight * cell +
+                  self._at_inception(-self.cube['MAP004', 'Gross_CSM']))
+        _, release, _ = amortise(change, np.nan_to_num(fractions))
+        return np.where(np.isnan(fractions), cell, release / weight)
+
+    @property
+    def _release_column(self):
+        key, measure = RELEASE_CELL
+        return KEYS.index(key) * len(MEASURES) + MEASURES.index(measure)
+
+    def _release(self, mapped, cube, cell):
+        # Mapped lines with the release cell of the cube set to ``cell``
+        delta = cell - cube[RELEASE_CELL]
+        coefficients = self.mapping.matrix[:, self._release_column]
+        return mapped + delta[..., None] * coefficients
+
+    @stage
+    def _movements(self):
+        return {
+            'BEL':
+            self._lines(
+                self._new_business("LIABILITY ON INITIAL RECOGNITION-BE",
+                                   'Gross_BECFPV'),
+                self.mapping.report('BEL', self.mapped)),
+            'RA':
+            self._lines(
+                self._new_business("LIABILITY ON INITIAL RECOGNITION-RA",
+                                   'Gross_RACFPV'),
+                self.mapping.report('RA', self.mapped)),
+            'CSM':
+            self._lines(
+                self._at_inception(-self.cube['MAP004', 'Gross_CSM']),
+                self.mapping.report('CSM', self.mapped)),
+        }
+
+    @stage
+    def _reconciliations(self):
+        # Roll BEL, RA and CSM forward together over the period axis
+        opening, closing = roll_forward(
+            np.stack([
+                sum(lines.values()) for lines in self._movements.values()
+            ]))
+
+        reconciliations = {}
+        for i, (name, lines) in enumerate(self._movements.items()):
+            columns = {"Opening Balance": opening[i]}
+            columns.update(lines)
+            columns["Closing Balance"] = closing[i]
+            reconciliations[name] = self._frame(columns)
+        return reconciliations
+
+    @stage
+    def fingerprints(self):
+        # Digest of each group's aggregated assumptions and coverage units,
+        # together with the settings and mapping that every group is
+        # evaluated with
+        run = hashlib.blake2b(repr(sorted(
+            self.settings.items())).encode())
+        run.update(self.mapping.matrix.tobytes())
+
+        fractions = self._coverage_fractions
+        digests = []
+        for g, values in enumerate(self.cube.by_type):
+            digest = run.copy()
+            digest.update(np.ascontiguousarray(values).tobytes())
+            if fractions is not None:
+                digest.update(fractions[g].tobytes())
+            digests.append(digest.hexdigest())
+        return pd.Series(digests, index=self.cube.groups, dtype=object)
+
+    @cached_property
+    def _dirty(self):
+        # Groups that changed since the previous run
+        previous = self._previous.fingerprints.reindex(self.cube.groups)
+        return self.cube.groups[(self.fingerprints != previous).to_numpy()]
+
+    @cached_property
+    def _dirty_engine(self):
+        rows = pd.MultiIndex.from_frame(
+            self.Assumptions[self._dirty.names]).isin(self._dirty)
+        return GMMEngine(self.Assumptions.loc[rows],
+                         self.Parameters,
+                         mapping=self._mapping,
+                         workers=self.workers,
+                         by_cohort=self.by_cohort,
+                         coverage_units=self.Coverage_Units)
+
+    def _merge_groups(self, report):
+        # Unchanged groups are copied from the previous run, changed ones
+        # come from an engine over their rows only, in this run's group order
+        previous = getattr(self._previous, report)
+        clean = self.cube.groups.difference(self._dirty)
+        frames = [previous.loc[_group_labels(previous, clean).isin(clean)]]
+        if len(self._dirty) > 0:
+            frames.append(getattr(self._dirty_engine, report))
+
+        merged = pd.concat(frames)
+        order = self.cube.groups.get_indexer(
+            _group_labels(merged, self.cube.groups))
+        merged = merged.iloc[np.argsort(order, kind='stable')]
+        if report in ('AMC', 'ARC'):
+            merged = merged.reset_index(drop=True)
+        return merged
+
+    @cached_property
+    def _chunks(self):
+        # Chunks of groups for the process pool, none when running serially
+        if self.workers > 1:
+            chunks = group_chunks(self.Assumptions,
+                                  self.workers * CHUNKS_PER_WORKER)
+            if len(chunks) > 1:
+                return chunks
+        return []
+
+    @cached_property
+    def _chunk_reports(self):
+        # Reports evaluated so far in each chunk of a parallel run
+        return [{} for _ in self._chunks]
+
+    def _evaluate_chunks(self, names):
+        # Groups are independent, each chunk of groups is evaluated in its
+        # own process. The reports the workers evaluate on the way are kept,
+        # so later accesses to them do not use the pool again.
+        names = [name for name in names if name not in self._chunk_reports[0]]
+        if not names:
+            return
+        results = map_chunks(
+            partial(_reports,
+                    parameters=self.Parameters,
+                    mapping=self._mapping,
+                    by_cohort=self.by_cohort,
+                    coverage_units=self.Coverage_Units,
+                    profile_memory=self.timer.memory,
+                    names=names), self._chunks, self.workers)
+        for chunk, (reports, (result, timer)) in enumerate(
+                zip(self._chunk_reports, results)):
+            reports.update(result)
+            self.timer.merge(timer, chunk)
+
+    def _merge_chunks(self, report):
+        # Reports are stacked back in group order
+        self._evaluate_chunks([report])
+        return pd.concat([result[report] for result in self._chunk_reports],
+                         ignore_index=report in ('AMC', 'ARC'))
+
+    @cached_property
+    def _inception(self):
+        # Period in which each group is initially recognised, -1 outside the
+        # run. Groups of contracts are recognised in their cohort's year,
+        # other groups at the inception date. Sub-annual runs use the
+        # period holding that date.
+        groups = self.cube.groups
+        if 'Cohort' in groups.names:
+            dates = pd.to_datetime(
+                groups.get_level_values('Cohort').astype(int).astype(str),
+                format='%Y')
+        else:
+            dates = pd.DatetimeIndex([self.settings['inception_date']] *
+                                     len(groups))
+
+        if self.settings['frequency'] is None:
+            labels = dates.year
+        else:
+            labels = dates.to_period(self.settings['frequency'])
+        return self.cube.periods.get_indexer(labels)
+
+    def _initial_recognition(self, cube):
+        lir = pd.DataFrame(data=0.0,
+                           index=cube.groups,
+                           columns=INITIAL_RECOGNITION_COLUMNS)
+
+        t = self._inception
+        rows = np.flatnonzero(t >= 0)
+
+        def at_inception(key, measure):
+            values = np.zeros(len(t))
+            values[rows] = cube[key, measure][rows, t[rows]]
+            return values
+
+        if self.settings['csm_mode'] == "Input":
+            lir["CSM at Initial Recognition"] = at_inception(
+                'MAP004', 'Gross_CSM')
+            lir["LIABILITY ON INITIAL RECOGNITION-BE"] = at_inception(
+                'MAP004', 'Gross_LossC_BE')
+            lir["LIABILITY ON INITIAL RECOGNITION-RA"] = at_inception(
+                'MAP004', 'Gross_LossC_RA')
+
+        elif self.settings['csm_mode'] == "Calculation":
+            lir["PV Premium"] = at_inception('MAP003', 'Gross_BECFPV')
+            lir["PV Claims"] = at_inception('MAP013', 'Gross_BECFPV')
+            lir["PV Risk Adjustment"] = at_inception('MAP013', 'Gross_RACFPV')
+            lir["PV Acquisition Expense"] = at_inception(
+                'MAP016', 'Gross_BECFPV')
+
+            total = lir[[
+                "PV Premium", "PV Claims", "PV Risk Adjustment",
+                "PV Acquisition Expense"
+            ]].sum(axis=1).to_numpy()
+
+            # Onerous groups split the loss between BE and RA in proportion
+            # to the present value of claims
+            claims = lir["PV Claims"].to_numpy() + lir[
+                "PV Risk Adjustment"].to_numpy()
+            onerous = (total <= 0) & (claims != 0)
+            safe_claims = np.where(claims == 0, 1.0, claims)
+
+            lir["CSM at Initial Recognition"] = np.where(
+                total > 0, total, 0.0)
+            lir["LIABILITY ON INITIAL RECOGNITION-BE"] = np.where(
+                onerous, total * lir["PV Claims"].to_numpy() / safe_claims,
+                0.0)
+            lir["LIABILITY ON INITIAL RECOGNITION-RA"] = np.where(
+                onerous,
+                total * lir["PV Risk Adjustment"].to_numpy() / safe_claims,
+                0.0)
+
+        return lir
+
+    def _at_inception(self, values):
+        # Keep only the inception period of a (group x period) array
+        recognised = np.zeros((len(self.cube.groups), len(self.cube.periods)))
+        t = self._inception
+        rows = np.flatnonzero(t >= 0)
+        recognised[rows, t[rows]] = np.broadcast_to(
+            values, recognised.shape)[rows, t[rows]]
+        return recognised
+
+    def _new_business(self, liability, measure):
+        loss = self.Liability_on_Initial_Recognition[liability].to_numpy()
+        return self._at_inception(
+            np.where(loss[:, None] == 0, self.cube['MAP013', measure],
+                     loss[:, None]))
+
+    def _lines(self, new_business, lines):
+        shape = (len(self.cube.groups), len(self.cube.periods))
+        lines = dict(lines)
+        lines["Changes Related to Future Service: New Business"] = new_business
+
+        # Lines added through the mapping are shown before the closing balance
+        names = RECONCILIATION_COLUMNS[1:-1] + [
+            line for line in lines if line not in RECONCILIATION_COLUMNS
+        ]
+        return {name: lines.get(name, np.zeros(shape)) for name in names}
+
+    def _frame(self, columns):
+        groups = self.cube.groups
+        periods = self.cube.periods
+        frame = pd.DataFrame(
+            {
+                name: np.repeat(groups.get_level_values(name), len(periods))
+                for name in groups.names
+            },
+            index=pd.Index(np.tile(periods, len(groups)), name='Period'))
+        for column, values in columns.items():
+            frame[column] = values.reshape(-1)
+        return frame
+
+
+def _group_labels(frame, groups):
+    # Group of every row of a report
+    if set(groups.names).issubset(frame.columns):
+        return pd.MultiIndex.from_frame(frame[groups.names])
+    return frame.index
+
+
+def _reports(assumptions, parameters, mapping, by_cohort, coverage_units,
+             profile_memory, names):
+    # Runs in a worker process of GMMEngine, returns the reports asked for,
+    # every other report evaluated with them and the timer of the chunk
+    engine = GMMEngine(assumptions,
+                       parameters,
+                       mapping,
+                       by_cohort=by_cohort,
+                       profile_memory=profile_memory,
+                       coverage_units=coverage_units)
+    for name in names:
+        engine.reports(RECONCILIATIONS if name in RECONCILIATIONS else [name])
+    return {
+        name: getattr(engine, name)
+        for name in REPORTS if name in vars(engine)
+    }, engine.timer
@@ -2,14 +2,27 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from IFRS17.profiling import StageTimer
+from IFRS17.sinks import write_reports
+
 
 class GMM:
 
-    def __init__(self, assumptions, parameters):
-        
-        data = pd.pivot_table(
-            assumptions,
-            index=['Cohort', 'Product', 'Sub-Product', 'Key'],
+    def __init__(self,
+                 assumptions,
+                 parameters,
+                 sink=None,
+                 profile_memory=False):
+
+        timer = StageTimer(memory=profile_memory)
+        timer.start('pivot_table', rows=len(assumptions.index))
+
+        # Assumptions are aggregated once at the finest grain, the view
+        # without BusinessType is summed from it rather than re-pivoted. A
+        # missing BusinessType still counts towards that view.
+        data_2 = pd.pivot_table(
+            assumptions.fillna({'BusinessType': ''}),
+            index=['Cohort', 'Product', 'Sub-Product', 'BusinessType', 'Key'],
             aggfunc={
                 'Gross_BE': 'sum',
                 'Gross_LossC_BE': 'sum',
@@ -21,18 +34,35 @@ class GMM:
                 'Gross_Actual': 'sum'
             })
 
+        data = data_2.groupby(['Cohort', 'Product', 'Sub-Product',
+                               'Key']).sum()
+
         data = data.reset_index()
+        data_2 = data_2.reset_index()
 
+        timer.start('groupby', rows=len(data.index))
         data_dict = {
             'assumption_' + str(i): grp
             for i, grp in data.groupby(['Product', 'Sub-Product'])
         }
-
-        def iferror(y):
-            if len(y.index) == 0:
+        timer.size('data', data)
+        timer.size('data_2', data_2)
+        timer.size('data_dict', data_dict)
+
+        # Assumptions are read through a hash index built once per group,
+        # missing rows count as 0
+        def index_assumptions(frame, keys):
+            return frame.set_index(keys).to_dict('index')
+
+        def assumption(key, cohort, column, business_type=None):
+            if business_type is None:
+                row = self.Lookup.get((cohort, key))
+            else:
+                row = self.Lookup.get((cohort, business_type, key))
+            if row is None:
                 return 0
             else:
-                return y.item()
+                return row[column]
 
         self.Parameters = parameters
 
@@ -40,22 +70,27 @@ class GMM:
                                   '%d/%m/%Y').year
         end = datetime.strptime(self.Parameters.loc[1, "Selection"],
                                 '%d/%m/%Y').year
-        
-        
+
+
         self.BEL = []
         self.RA = []
         self.CSM = []
-        self.TCL = []     
+        self.TCL = []
         self.AMC = []
         self.ARC = []
 
-        count = 0
         for group in data_dict:
+            count = 0
             cohort1 = data_dict[group]
             product_name = cohort1['Product'].unique().item()
             subproduct_name = cohort1['Sub-Product'].unique().item()
 
+            rows = len(cohort1.index)
+            timer.start('Liability_on_Initial_Recognition',
+                        (product_name, subproduct_name), rows)
+
             self.Assumptions = cohort1
+            self.Lookup = index_assumptions(cohort1, ['Cohort', 'Key'])
 
             self.Liability_on_Initial_Recognition = pd.DataFrame(
                 data=0,
@@ -156,50 +191,30 @@ class GMM:
             if self.Parameters.loc[2, "Selection"] == "Input":
 
                 self.Liability_on_Initial_Recognition.loc[
-                    start, "CSM at Initial Recognition"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP004') &
-                            (self.Assumptions['Cohort'] == start),
-                            'Gross_CSM'])
+                    start, "CSM at Initial Recognition"] = assumption(
+                        'MAP004', start, 'Gross_CSM')
                 self.Liability_on_Initial_Recognition.loc[
-                    start,
-                    "LIABILITY ON INITIAL RECOGNITION-BE"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP004') &
-                            (self.Assumptions['Cohort'] == start),
-                            'Gross_LossC_BE'])
+                    start, "LIABILITY ON INITIAL RECOGNITION-BE"] = assumption(
+                        'MAP004', start, 'Gross_LossC_BE')
                 self.Liability_on_Initial_Recognition.loc[
-                    start,
-                    "LIABILITY ON INITIAL RECOGNITION-RA"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP004') &
-                            (self.Assumptions['Cohort'] == start),
-                            'Gross_LossC_RA'])
+                    start, "LIABILITY ON INITIAL RECOGNITION-RA"] = assumption(
+                        'MAP004', start, 'Gross_LossC_RA')
 
             elif self.Parameters.loc[2, "Selection"] == "Calculation":
 
                 self.Liability_on_Initial_Recognition.loc[
-                    start, "PV Premium"] = iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP003') &
-                        (self.Assumptions['Cohort'] == start),
-                        'Gross_BECFPV'])
+                    start, "PV Premium"] = assumption('MAP003', start,
+                                                      'Gross_BECFPV')
                 self.Liability_on_Initial_Recognition.loc[
-                    start, "PV Claims"] = iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == start),
-                        'Gross_BECFPV'])
+                    start, "PV Claims"] = assumption('MAP013', start,
+                                                     'Gross_BECFPV')
                 self.Liability_on_Initial_Recognition.loc[
                     start,
-                    "PV Risk Adjustment"] = iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == start),
-                        'Gross_RACFPV'])
+                    "PV Risk Adjustment"] = assumption('MAP013', start,
+                                                       'Gross_RACFPV')
                 self.Liability_on_Initial_Recognition.loc[
-                    start,
-                    "PV Acquisition Expense"] = iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP016') &
-                        (self.Assumptions['Cohort'] == start),
-                        'Gross_BECFPV'])
+                    start, "PV Acquisition Expense"] = assumption(
+                        'MAP016', start, 'Gross_BECFPV')
                 Total = self.Liability_on_Initial_Recognition.loc[
                     start,
                     "PV Premium"] + self.Liability_on_Initial_Recognition.loc[
@@ -223,51 +238,31 @@ class GMM:
                     self.Liability_on_Initial_Recognition.loc[
                         start,
                         "LIABILITY ON INITIAL RECOGNITION-BE"] = (Total * (
-                            (iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP013') &
-                                (self.Assumptions['Cohort'] == start),
-                                'Gross_BECFPV'])) /
-                            (iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP013') &
-                                (self.Assumptions['Cohort'] == start),
-                                'Gross_BECFPV']) +
-                             iferror(self.Assumptions.loc[
-                                 (self.Assumptions['Key'] == 'MAP013') &
-                                 (self.Assumptions['Cohort'] == start),
-                                 'Gross_RACFPV']))))
+                            (assumption('MAP013', start, 'Gross_BECFPV')) /
+                            (assumption('MAP013', start, 'Gross_BECFPV') +
+                             assumption('MAP013', start, 'Gross_RACFPV'))))
                     self.Liability_on_Initial_Recognition.loc[
                         start,
                         "LIABILITY ON INITIAL RECOGNITION-RA"] = (Total * (
-                            (iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP013') &
-                                (self.Assumptions['Cohort'] == start),
-                                'Gross_RACFPV'])) /
-                            (iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP013') &
-                                (self.Assumptions['Cohort'] == start),
-                                'Gross_BECFPV']) +
-                             iferror(self.Assumptions.loc[
-                                 (self.Assumptions['Key'] == 'MAP013') &
-                                 (self.Assumptions['Cohort'] == start),
-                                 'Gross_RACFPV']))))
+                            (assumption('MAP013', start, 'Gross_RACFPV')) /
+                            (assumption('MAP013', start, 'Gross_BECFPV') +
+                             assumption('MAP013', start, 'Gross_RACFPV'))))
 
             # Reconciliation of Best Estimate Liability
+            timer.start('BEL', (product_name, subproduct_name), rows)
 
             for i in range(start, end + 1):
-                
+
 
                 if i == start:
                     self.Reconciliation_of_Best_Estimate_Liability.loc[
                         i, "Opening Balance"] = 0
                     if self.Liability_on_Initial_Recognition.loc[i, "LIABILITY ON INITIAL RECOGNITION-BE"] == 0:
-                        
+
                         self.Reconciliation_of_Best_Estimate_Liability.loc[
                             i,
-                            "Changes Related to Future Service: New Business"] = iferror(
-                                self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP013') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_BECFPV'])
+                            "Changes Related to Future Service: New Business"] = assumption(
+                                'MAP013', i, 'Gross_BECFPV')
                     else:
                         self.Reconciliation_of_Best_Estimate_Liability.loc[
                             i,
@@ -291,107 +286,39 @@ class GMM:
 
                 self.Reconciliation_of_Best_Estimate_Liability.loc[
                     i,
-                    "Changes Related to Future Service: Assumptions"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP001') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_BE']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP001') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_LossC_BE']) + iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP005') &
-                                (self.Assumptions['Cohort'] == i), 'Gross_BE']
-                        ) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP005') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP006') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_BE']) + iferror(
-                                    self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP006') &
-                                        (self.Assumptions['Cohort'] == i),
-                                        'Gross_LossC_BE']
-                                ) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP008') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_BE']) + iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP008') &
-                                            (self.Assumptions['Cohort'] == i),
-                                            'Gross_LossC_BE']
-                                    ) + iferror(self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP009') &
-                                        (self.Assumptions['Cohort'] == i),
-                                        'Gross_BE']) + iferror(
-                                            self.Assumptions.loc[
-                                                (self.Assumptions['Key'] ==
-                                                 'MAP009') &
-                                                (self.Assumptions['Cohort'] ==
-                                                 i), 'Gross_LossC_BE']
-                                        ) + iferror(
-                                            self.Assumptions.loc[
-                                                (self.Assumptions['Key'] ==
-                                                 'MAP011') &
-                                                (self.Assumptions['Cohort'] ==
-                                                 i), 'Gross_BE']
-                                        ) + iferror(self.Assumptions.loc[
-                                            (self.
-                                             Assumptions['Key'] == 'MAP011') &
-                                            (self.Assumptions['Cohort'] == i),
-                                            'Gross_LossC_BE']) + iferror(
-                                                self.Assumptions.loc[
-                                                    (self.Assumptions['Key'] ==
-                                                     'MAP018') &
-                                                    (self.Assumptions['Cohort']
-                                                     == i), 'Gross_BE']
-                                            ) + iferror(self.Assumptions.loc[
-                                                (self.Assumptions['Key'] ==
-                                                 'MAP018') &
-                                                (self.Assumptions['Cohort'] ==
-                                                 i), 'Gross_LossC_BE'])
+                    "Changes Related to Future Service: Assumptions"] = assumption(
+                        'MAP001', i, 'Gross_BE'
+                    ) + assumption('MAP001', i, 'Gross_LossC_BE') + assumption(
+                        'MAP005', i, 'Gross_BE'
+                    ) + assumption('MAP005', i, 'Gross_LossC_BE') + assumption(
+                        'MAP006', i, 'Gross_BE'
+                    ) + assumption('MAP006', i, 'Gross_LossC_BE') + assumption(
+                        'MAP008', i, 'Gross_BE'
+                    ) + assumption('MAP008', i, 'Gross_LossC_BE') + assumption(
+                        'MAP009', i, 'Gross_BE') + assumption(
+                            'MAP009', i, 'Gross_LossC_BE') + assumption(
+                                'MAP011', i, 'Gross_BE') + assumption(
+                                    'MAP011', i,
+                                    'Gross_LossC_BE') + assumption(
+                                        'MAP018', i, 'Gross_BE') + assumption(
+                                            'MAP018', i, 'Gross_LossC_BE')
                 self.Reconciliation_of_Best_Estimate_Liability.loc[
-                    i, "Insurance Service Expense"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP007') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_BE']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP007') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP010') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP010') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_LossC_BE'])
+                    i, "Insurance Service Expense"] = assumption(
+                        'MAP007', i, 'Gross_BE') + assumption(
+                            'MAP007', i, 'Gross_LossC_BE') + assumption(
+                                'MAP010', i, 'Gross_BE') + assumption(
+                                    'MAP010', i, 'Gross_LossC_BE')
                 self.Reconciliation_of_Best_Estimate_Liability.loc[
                     i,
-                    "Changes Related to Current Service: Release"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_BE']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP014') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP014') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_LossC_BE'])
+                    "Changes Related to Current Service: Release"] = assumption(
+                        'MAP013', i, 'Gross_BE') + assumption(
+                            'MAP013', i, 'Gross_LossC_BE') + assumption(
+                                'MAP014', i, 'Gross_BE') + assumption(
+                                    'MAP014', i, 'Gross_LossC_BE')
                 self.Reconciliation_of_Best_Estimate_Liability.loc[
-                    i, "Changes Related to Past Service"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP017') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP017') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_LossC_BE'])
+                    i, "Changes Related to Past Service"] = assumption(
+                        'MAP017', i, 'Gross_BE') + assumption(
+                            'MAP017', i, 'Gross_LossC_BE')
                 self.Reconciliation_of_Best_Estimate_Liability.loc[
                     i,
                     "Closing Balance"] = self.Reconciliation_of_Best_Estimate_Liability.loc[
@@ -411,6 +338,7 @@ class GMM:
                                                 "Changes Related to Current Service: Experience"]
 
             # Reconciliation of Risk Adjustment
+            timer.start('RA', (product_name, subproduct_name), rows)
 
             for i in range(start, end + 1):
                 if i == start:
@@ -421,11 +349,8 @@ class GMM:
                             i, "LIABILITY ON INITIAL RECOGNITION-RA"] == 0:
                         self.Reconciliation_of_Risk_Adjustment.loc[
                             i,
-                            "Changes Related to Future Service: New Business"] = iferror(
-                                self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP013') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_RACFPV'])
+                            "Changes Related to Future Service: New Business"] = assumption(
+                                'MAP013', i, 'Gross_RACFPV')
                     else:
                         self.Reconciliation_of_Risk_Adjustment.loc[
                             i,
@@ -448,107 +373,39 @@ class GMM:
 
                 self.Reconciliation_of_Risk_Adjustment.loc[
                     i,
-                    "Changes Related to Future Service: Assumptions"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP001') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_RA']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP001') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_LossC_RA']) + iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP005') &
-                                (self.Assumptions['Cohort'] == i), 'Gross_RA']
-                        ) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP005') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_RA']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP006') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_RA']) + iferror(
-                                    self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP006') &
-                                        (self.Assumptions['Cohort'] == i),
-                                        'Gross_LossC_RA']
-                                ) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP008') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_RA']) + iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP008') &
-                                            (self.Assumptions['Cohort'] == i),
-                                            'Gross_LossC_RA']
-                                    ) + iferror(self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP009') &
-                                        (self.Assumptions['Cohort'] == i),
-                                        'Gross_RA']) + iferror(
-                                            self.Assumptions.loc[
-                                                (self.Assumptions['Key'] ==
-                                                 'MAP009') &
-                                                (self.Assumptions['Cohort'] ==
-                                                 i), 'Gross_LossC_RA']
-                                        ) + iferror(
-                                            self.Assumptions.loc[
-                                                (self.Assumptions['Key'] ==
-                                                 'MAP011') &
-                                                (self.Assumptions['Cohort'] ==
-                                                 i), 'Gross_RA']
-                                        ) + iferror(self.Assumptions.loc[
-                                            (self.
-                                             Assumptions['Key'] == 'MAP011') &
-                                            (self.Assumptions['Cohort'] == i),
-                                            'Gross_LossC_RA']) + iferror(
-                                                self.Assumptions.loc[
-                                                    (self.Assumptions['Key'] ==
-                                                     'MAP018') &
-                                                    (self.Assumptions['Cohort']
-                                                     == i), 'Gross_RA']
-                                            ) + iferror(self.Assumptions.loc[
-                                                (self.Assumptions['Key'] ==
-                                                 'MAP018') &
-                                                (self.Assumptions['Cohort'] ==
-                                                 i), 'Gross_LossC_RA'])
+                    "Changes Related to Future Service: Assumptions"] = assumption(
+                        'MAP001', i, 'Gross_RA'
+                    ) + assumption('MAP001', i, 'Gross_LossC_RA') + assumption(
+                        'MAP005', i, 'Gross_RA'
+                    ) + assumption('MAP005', i, 'Gross_LossC_RA') + assumption(
+                        'MAP006', i, 'Gross_RA'
+                    ) + assumption('MAP006', i, 'Gross_LossC_RA') + assumption(
+                        'MAP008', i, 'Gross_RA'
+                    ) + assumption('MAP008', i, 'Gross_LossC_RA') + assumption(
+                        'MAP009', i, 'Gross_RA') + assumption(
+                            'MAP009', i, 'Gross_LossC_RA') + assumption(
+                                'MAP011', i, 'Gross_RA') + assumption(
+                                    'MAP011', i,
+                                    'Gross_LossC_RA') + assumption(
+                                        'MAP018', i, 'Gross_RA') + assumption(
+                                            'MAP018', i, 'Gross_LossC_RA')
                 self.Reconciliation_of_Risk_Adjustment.loc[
-                    i, "Insurance Service Expense"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP007') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_RA']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP007') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_LossC_RA']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP010') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_RA']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP010') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_LossC_RA'])
+                    i, "Insurance Service Expense"] = assumption(
+                        'MAP007', i, 'Gross_RA') + assumption(
+                            'MAP007', i, 'Gross_LossC_RA') + assumption(
+                                'MAP010', i, 'Gross_RA') + assumption(
+                                    'MAP010', i, 'Gross_LossC_RA')
                 self.Reconciliation_of_Risk_Adjustment.loc[
                     i,
-                    "Changes Related to Current Service: Release"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_RA']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_LossC_RA']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP014') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_RA']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP014') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_LossC_RA'])
+                    "Changes Related to Current Service: Release"] = assumption(
+                        'MAP013', i, 'Gross_RA') + assumption(
+                            'MAP013', i, 'Gross_LossC_RA') + assumption(
+                                'MAP014', i, 'Gross_RA') + assumption(
+                                    'MAP014', i, 'Gross_LossC_RA')
                 self.Reconciliation_of_Risk_Adjustment.loc[
-                    i, "Changes Related to Past Service"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP017') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_RA']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP017') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_LossC_RA'])
+                    i, "Changes Related to Past Service"] = assumption(
+                        'MAP017', i, 'Gross_RA') + assumption(
+                            'MAP017', i, 'Gross_LossC_RA')
                 self.Reconciliation_of_Risk_Adjustment.loc[
                     i,
                     "Closing Balance"] = self.Reconciliation_of_Risk_Adjustment.loc[
@@ -568,6 +425,7 @@ class GMM:
                                                 "Changes Related to Current Service: Experience"]
 
             # Reconciliation of Contractual Service Margin
+            timer.start('CSM', (product_name, subproduct_name), rows)
 
             for i in range(start, end + 1):
                 if i == start:
@@ -576,11 +434,8 @@ class GMM:
                         "Opening Balance"] = 0
                     self.Reconciliation_of_Contractual_Service_Margin.loc[
                         i,
-                        "Changes Related to Future Service: New Business"] = iferror(
-                            -(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP004')
-                                & (self.Assumptions['Cohort'] == i),
-                                'Gross_CSM']))
+                        "Changes Related to Future Service: New Business"] = -assumption(
+                            'MAP004', i, 'Gross_CSM')
 
                 else:
                     self.Reconciliation_of_Contractual_Service_Margin.loc[
@@ -598,48 +453,24 @@ class GMM:
 
                 self.Reconciliation_of_Contractual_Service_Margin.loc[
                     i, "Changes Related to Future Service: Assumptions"] = -(
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP001') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP005') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP006') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP008') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP009') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP011') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP018') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']))
+                        assumption('MAP001', i, 'Gross_CSM') +
+                        assumption('MAP005', i, 'Gross_CSM') +
+                        assumption('MAP006', i, 'Gross_CSM') +
+                        assumption('MAP008', i, 'Gross_CSM') +
+                        assumption('MAP009', i, 'Gross_CSM') +
+                        assumption('MAP011', i, 'Gross_CSM') +
+                        assumption('MAP018', i, 'Gross_CSM'))
                 self.Reconciliation_of_Contractual_Service_Margin.loc[
                     i, "Insurance Service Expense"] = -(
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP007') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP010') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']))
+                        assumption('MAP007', i, 'Gross_CSM') +
+                        assumption('MAP010', i, 'Gross_CSM'))
                 self.Reconciliation_of_Contractual_Service_Margin.loc[
                     i, "Changes Related to Current Service: Release"] = -(
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP014') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']))
+                        assumption('MAP013', i, 'Gross_CSM') +
+                        assumption('MAP014', i, 'Gross_CSM'))
                 self.Reconciliation_of_Contractual_Service_Margin.loc[
-                    i, "Changes Related to Past Service"] = -(iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP017') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']))
+                    i, "Changes Related to Past Service"] = -(assumption(
+                        'MAP017', i, 'Gross_CSM'))
                 self.Reconciliation_of_Contractual_Service_Margin.loc[
                     i,
                     "Closing Balance"] = self.Reconciliation_of_Contractual_Service_Margin.loc[
@@ -659,6 +490,7 @@ class GMM:
                                                 "Changes Related to Current Service: Experience"]
 
             # Reconciliation of Total Contract Liability
+            timer.start('TCL', (product_name, subproduct_name), rows)
 
             for i in range(start, end + 1):
                 self.Reconciliation_of_Total_Contract_Liability.loc[
@@ -726,6 +558,7 @@ class GMM:
                                 i, "Closing Balance"]
 
             # Analysis by measurement Component
+            timer.start('AMC', (product_name, subproduct_name), rows)
 
             for i in range(start, end + 1):
                 for s in measure_abmc:
@@ -886,50 +719,29 @@ class GMM:
                     (self.Analysis_by_measurement_component['Period'] == i) &
                     (self.Analysis_by_measurement_component['Measure'] ==
                      "Present value of future cash flows"),
-                    "Experience adjustments"] = iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_BE']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP014') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_BE']) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP014') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_LossC_BE'])
+                    "Experience adjustments"] = assumption(
+                        'MAP013', i, 'Gross_BE') + assumption(
+                            'MAP013', i, 'Gross_LossC_BE') + assumption(
+                                'MAP014', i, 'Gross_BE') + assumption(
+                                    'MAP014', i, 'Gross_LossC_BE')
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ) & (
                     self.Analysis_by_measurement_component['Measure'] ==
                     "Risk Adjustment"
-                ), "Risk Adjustment recognised for the risk expired"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_RA']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_RA']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP014') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_RA']) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP014') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_LossC_RA'])
+                ), "Risk Adjustment recognised for the risk expired"] = assumption(
+                    'MAP013', i, 'Gross_RA') + assumption(
+                        'MAP013', i, 'Gross_LossC_RA') + assumption(
+                            'MAP014', i, 'Gross_RA') + assumption(
+                                'MAP014', i, 'Gross_LossC_RA')
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ) & (
                     self.Analysis_by_measurement_component['Measure'] ==
                     "Contractual Service Margin"
                 ), "CSM recognised in profit or loss for the services provided"] = -(
-                    iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                    iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP014') &
-                        (self.Assumptions['Cohort'] == i), 'Gross_CSM']))
+                    assumption('MAP013', i, 'Gross_CSM') +
+                    assumption('MAP014', i, 'Gross_CSM'))
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ), "Changes that relate to current service"] = self.Analysis_by_measurement_component.loc[(
@@ -1023,168 +835,72 @@ class GMM:
                     (self.Analysis_by_measurement_component['Period'] == i) &
                     (self.Analysis_by_measurement_component['Measure'] ==
                      "Present value of future cash flows"),
-                    "Changes in estimates that adjust the CSM"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP001') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_BE']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP001') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_LossC_BE']) + iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP005') &
-                                (self.Assumptions['Cohort'] == i), 'Gross_BE']
-                        ) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP005') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP006') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_BE']) + iferror(
-                                    self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP006') &
-                                        (self.Assumptions['Cohort'] == i),
-                                        'Gross_LossC_BE']
-                                ) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP008') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_BE']) + iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP008') &
-                                            (self.Assumptions['Cohort'] == i),
-                                            'Gross_LossC_BE']
-                                    ) + iferror(self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP009') &
-                                        (self.Assumptions['Cohort'] == i),
-                                        'Gross_BE']) + iferror(
-                                            self.Assumptions.loc[
-                                                (self.Assumptions['Key'] ==
-                                                 'MAP009') &
-                                                (self.Assumptions['Cohort'] ==
-                                                 i), 'Gross_LossC_BE']
-                                        ) + iferror(self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP011') &
-                                            (self.Assumptions['Cohort'] == i),
-                                            'Gross_BE']) + iferror(
-                                                self.Assumptions.loc[
-                                                    (self.Assumptions['Key'] ==
-                                                     'MAP011') &
-                                                    (self.Assumptions['Cohort']
-                                                     == i), 'Gross_LossC_BE'])
+                    "Changes in estimates that adjust the CSM"] = assumption(
+                        'MAP001', i, 'Gross_BE'
+                    ) + assumption('MAP001', i, 'Gross_LossC_BE') + assumption(
+                        'MAP005', i, 'Gross_BE'
+                    ) + assumption('MAP005', i, 'Gross_LossC_BE') + assumption(
+                        'MAP006', i, 'Gross_BE'
+                    ) + assumption('MAP006', i, 'Gross_LossC_BE') + assumption(
+                        'MAP008', i, 'Gross_BE') + assumption(
+                            'MAP008', i, 'Gross_LossC_BE') + assumption(
+                                'MAP009', i, 'Gross_BE') + assumption(
+                                    'MAP009', i,
+                                    'Gross_LossC_BE') + assumption(
+                                        'MAP011', i, 'Gross_BE') + assumption(
+                                            'MAP011', i, 'Gross_LossC_BE')
                 self.Analysis_by_measurement_component.loc[
                     (self.Analysis_by_measurement_component['Period'] == i) &
                     (self.Analysis_by_measurement_component['Measure'] ==
                      "Risk Adjustment"),
-                    "Changes in estimates that adjust the CSM"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP001') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_RA']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP001') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_LossC_RA']) + iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP005') &
-                                (self.Assumptions['Cohort'] == i), 'Gross_RA']
-                        ) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP005') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_RA']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP006') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_RA']) + iferror(
-                                    self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP006') &
-                                        (self.Assumptions['Cohort'] == i),
-                                        'Gross_LossC_RA']
-                                ) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP008') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_RA']) + iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP008') &
-                                            (self.Assumptions['Cohort'] == i),
-                                            'Gross_LossC_RA']
-                                    ) + iferror(self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP009') &
-                                        (self.Assumptions['Cohort'] == i),
-                                        'Gross_RA']) + iferror(
-                                            self.Assumptions.loc[
-                                                (self.Assumptions['Key'] ==
-                                                 'MAP009') &
-                                                (self.Assumptions['Cohort'] ==
-                                                 i), 'Gross_LossC_RA']
-                                        ) + iferror(self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP011') &
-                                            (self.Assumptions['Cohort'] == i),
-                                            'Gross_RA']) + iferror(
-                                                self.Assumptions.loc[
-                                                    (self.Assumptions['Key'] ==
-                                                     'MAP011') &
-                                                    (self.Assumptions['Cohort']
-                                                     == i), 'Gross_LossC_RA'])
+                    "Changes in estimates that adjust the CSM"] = assumption(
+                        'MAP001', i, 'Gross_RA'
+                    ) + assumption('MAP001', i, 'Gross_LossC_RA') + assumption(
+                        'MAP005', i, 'Gross_RA'
+                    ) + assumption('MAP005', i, 'Gross_LossC_RA') + assumption(
+                        'MAP006', i, 'Gross_RA'
+                    ) + assumption('MAP006', i, 'Gross_LossC_RA') + assumption(
+                        'MAP008', i, 'Gross_RA') + assumption(
+                            'MAP008', i, 'Gross_LossC_RA') + assumption(
+                                'MAP009', i, 'Gross_RA') + assumption(
+                                    'MAP009', i,
+                                    'Gross_LossC_RA') + assumption(
+                                        'MAP011', i, 'Gross_RA') + assumption(
+                                            'MAP011', i, 'Gross_LossC_RA')
                 self.Analysis_by_measurement_component.loc[
                     (self.Analysis_by_measurement_component['Period'] == i) &
                     (self.Analysis_by_measurement_component['Measure'] ==
                      "Contractual Service Margin"),
                     "Changes in estimates that adjust the CSM"] = -(
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP001') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP005') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP006') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP008') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP009') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP011') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']))
+                        assumption('MAP001', i, 'Gross_CSM') +
+                        assumption('MAP005', i, 'Gross_CSM') +
+                        assumption('MAP006', i, 'Gross_CSM') +
+                        assumption('MAP008', i, 'Gross_CSM') +
+                        assumption('MAP009', i, 'Gross_CSM') +
+                        assumption('MAP011', i, 'Gross_CSM'))
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ) & (
                     self.Analysis_by_measurement_component['Measure'] ==
                     "Present value of future cash flows"
-                ), "Changes in onerous contract losses or reversal of losses"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP018') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_BE']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP018') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_BE'])
+                ), "Changes in onerous contract losses or reversal of losses"] = assumption(
+                    'MAP018', i, 'Gross_BE') + assumption(
+                        'MAP018', i, 'Gross_LossC_BE')
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ) & (
                     self.Analysis_by_measurement_component['Measure'] ==
                     "Risk Adjustment"
-                ), "Changes in onerous contract losses or reversal of losses"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP018') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_RA']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP018') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_RA'])
+                ), "Changes in onerous contract losses or reversal of losses"] = assumption(
+                    'MAP018', i, 'Gross_RA') + assumption(
+                        'MAP018', i, 'Gross_LossC_RA')
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ) & (
                     self.Analysis_by_measurement_component['Measure'] ==
                     "Contractual Service Margin"
-                ), "Changes in onerous contract losses or reversal of losses"] = iferror(
-                    self.Assumptions.loc[(self.Assumptions['Key'] == 'MAP018')
-                                         & (self.Assumptions['Cohort'] == i),
-                                         'Gross_CSM'])
+                ), "Changes in onerous contract losses or reversal of losses"] = assumption(
+                    'MAP018', i, 'Gross_CSM')
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ) & (
@@ -1296,38 +1012,28 @@ class GMM:
                              == "Contractual Service Margin"),
                             "Changes that relate to future service"]
 
-                self.Analysis_by_measurement_component.loc[
-                    (self.Analysis_by_measurement_component['Period'] == i) &
-                    (self.Analysis_by_measurement_component['Measure'] ==
-                     "Present value of future cash flows"),
-                    "Adjustments to liabilities for incurred claims"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP017') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP017') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_LossC_BE'])
-                self.Analysis_by_measurement_component.loc[
-                    (self.Analysis_by_measurement_component['Period'] == i) &
-                    (self.Analysis_by_measurement_component['Measure'] ==
-                     "Risk Adjustment"),
-                    "Adjustments to liabilities for incurred claims"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP017') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_RA']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP017') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_LossC_RA'])
+                self.Analysis_by_measurement_component.loc[(
+                    self.Analysis_by_measurement_component['Period'] == i
+                ) & (
+                    self.Analysis_by_measurement_component['Measure'] ==
+                    "Present value of future cash flows"
+                ), "Adjustments to liabilities for incurred claims"] = assumption(
+                    'MAP017', i, 'Gross_BE') + assumption(
+                        'MAP017', i, 'Gross_LossC_BE')
+                self.Analysis_by_measurement_component.loc[(
+                    self.Analysis_by_measurement_component['Period'] == i
+                ) & (
+                    self.Analysis_by_measurement_component['Measure'] ==
+                    "Risk Adjustment"
+                ), "Adjustments to liabilities for incurred claims"] = assumption(
+                    'MAP017', i, 'Gross_RA') + assumption(
+                        'MAP017', i, 'Gross_LossC_RA')
                 self.Analysis_by_measurement_component.loc[
                     (self.Analysis_by_measurement_component['Period'] == i) &
                     (self.Analysis_by_measurement_component['Measure'] ==
                      "Contractual Service Margin"),
                     "Adjustments to liabilities for incurred claims"] = -(
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP017') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']))
+                        assumption('MAP017', i, 'Gross_CSM'))
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ), "Changes that relate to past service"] = self.Analysis_by_measurement_component.loc[
@@ -1408,50 +1114,28 @@ class GMM:
                 ) & (
                     self.Analysis_by_measurement_component['Measure'] ==
                     "Present value of future cash flows"
-                ), "Finance expenses from insurance contracts issued"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP007') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_BE']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP007') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP010') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_BE']) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP010') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_LossC_BE'])
+                ), "Finance expenses from insurance contracts issued"] = assumption(
+                    'MAP007', i, 'Gross_BE') + assumption(
+                        'MAP007', i, 'Gross_LossC_BE') + assumption(
+                            'MAP010', i, 'Gross_BE') + assumption(
+                                'MAP010', i, 'Gross_LossC_BE')
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ) & (
                     self.Analysis_by_measurement_component['Measure'] ==
                     "Risk Adjustment"
-                ), "Finance expenses from insurance contracts issued"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP007') &
-                        (self.Assumptions['Cohort'] == i),
-                        'Gross_RA']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP007') &
-                            (self.Assumptions['Cohort'] == i),
-                            'Gross_LossC_RA']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP010') &
-                                (self.Assumptions['Cohort'] == i),
-                                'Gross_RA']) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP010') &
-                                    (self.Assumptions['Cohort'] == i),
-                                    'Gross_LossC_RA'])
+                ), "Finance expenses from insurance contracts issued"] = assumption(
+                    'MAP007', i, 'Gross_RA') + assumption(
+                        'MAP007', i, 'Gross_LossC_RA') + assumption(
+                            'MAP010', i, 'Gross_RA') + assumption(
+                                'MAP010', i, 'Gross_LossC_RA')
                 self.Analysis_by_measurement_component.loc[
                     (self.Analysis_by_measurement_component['Period'] == i) &
                     (self.Analysis_by_measurement_component['Measure'] ==
                      "Contractual Service Margin"),
                     "Finance expenses from insurance contracts issued"] = -(
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP007') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']) +
-                        iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP010') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_CSM']))
+                        assumption('MAP007', i, 'Gross_CSM') +
+                        assumption('MAP010', i, 'Gross_CSM'))
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ), "Investment Component and Premium Refund"] = self.Analysis_by_measurement_component.loc[
@@ -1532,26 +1216,21 @@ class GMM:
                     (self.Analysis_by_measurement_component['Period'] == i) &
                     (self.Analysis_by_measurement_component['Measure'] ==
                      "Present value of future cash flows"),
-                    "Premiums received"] = iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP002') &
-                        (self.Assumptions['Cohort'] == i), 'Gross_Actual'])
+                    "Premiums received"] = assumption('MAP002', i,
+                                                      'Gross_Actual')
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ) & (
                     self.Analysis_by_measurement_component['Measure'] ==
                     "Present value of future cash flows"
-                ), "Claims and other directly attributable expenses paid"] = iferror(
-                    self.Assumptions.loc[(self.Assumptions['Key'] == 'MAP012')
-                                         & (self.Assumptions['Cohort'] == i),
-                                         'Gross_Actual'])
+                ), "Claims and other directly attributable expenses paid"] = assumption(
+                    'MAP012', i, 'Gross_Actual')
                 self.Analysis_by_measurement_component.loc[
                     (self.Analysis_by_measurement_component['Period'] == i) &
                     (self.Analysis_by_measurement_component['Measure'] ==
                      "Present value of future cash flows"),
-                    "Insurance acquisition cash flows"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP015') &
-                            (self.Assumptions['Cohort'] == i), 'Gross_Actual'])
+                    "Insurance acquisition cash flows"] = assumption(
+                        'MAP015', i, 'Gross_Actual')
                 self.Analysis_by_measurement_component.loc[(
                     self.Analysis_by_measurement_component['Period'] == i
                 ), "Total cash flows"] = self.Analysis_by_measurement_component.loc[(
@@ -1672,54 +1351,40 @@ class GMM:
             self.CSM.append(self.Reconciliation_of_Contractual_Service_Margin)
             self.TCL.append(self.Reconciliation_of_Total_Contract_Liability)
             self.AMC.append(self.Analysis_by_measurement_component)
+            timer.size('AMC', self.Analysis_by_measurement_component,
+                       (product_name, subproduct_name))
 
+        timer.start('concat')
         self.BEL = pd.concat(self.BEL)
         self.RA = pd.concat(self.RA)
         self.CSM = pd.concat(self.CSM)
         self.TCL = pd.concat(self.TCL)
         self.AMC = pd.concat(self.AMC)
-        
-        self.BEL = self.BEL.to_csv('Reconciliation_of_Best_Estimate_Liability.csv')
-        self.RA = self.RA.to_csv('Reconciliation_of_Risk_Adjustment.csv')
-        self.CSM = self.CSM.to_csv('Reconciliation_of_Contractual_Service_Margin.csv')
-        self.TCL = self.TCL.to_csv('Reconciliation_of_Total_Contract_Liability.csv')
-        self.AMC = self.AMC.to_csv('Analysis_by_measurement_component.csv')
-        df_BEL = pd.DataFrame(self.BEL)
-        df_RA = pd.DataFrame(self.RA)
-        df_CSM = pd.DataFrame(self.CSM)
-        df_TCL = pd.DataFrame(self.TCL)
-        df_AMC = pd.DataFrame(self.AMC)
-        
+        timer.size('AMC', self.AMC)
 
-        # Analysis by remaining Coverage
-        data_2 = pd.pivot_table(
-            assumptions,
-            index=['Cohort', 'Product', 'Sub-Product', 'BusinessType', 'Key'],
-            aggfunc={
-                'Gross_BE': 'sum',
-                'Gross_LossC_BE': 'sum',
-                'Gross_RA': 'sum',
-                'Gross_LossC_RA': 'sum',
-                'Gross_CSM': 'sum',
-                'Gross_BECFPV': 'sum',
-                'Gross_RACFPV': 'sum',
-                'Gross_Actual': 'sum'
-            })
 
-        data_2 = data_2.reset_index()
 
+        # Analysis by remaining Coverage
+        timer.start('groupby_arc', rows=len(data_2.index))
         data_dict_2 = {
             'assumption_' + str(i): grp
             for i, grp in data_2.groupby(['Product', 'Sub-Product'])
         }
+        timer.size('data_dict_2', data_dict_2)
 
-        count = 0
         for group in data_dict_2:
+            count = 0
             Cohort_2 = data_dict_2[group]
             product_name = Cohort_2['Product'].unique()
             subproduct_name = Cohort_2['Sub-Product'].unique()
 
+            timer.start('ARC', (product_name.item(),
+                                subproduct_name.item()),
+                        len(Cohort_2.index))
+
             self.Assumptions = Cohort_2
+            self.Lookup = index_assumptions(
+                Cohort_2, ['Cohort', 'BusinessType', 'Key'])
 
             # Liability on Initial Recognition
 
@@ -1728,59 +1393,33 @@ class GMM:
                 if self.Parameters.loc[2, "Selection"] == "Input":
 
                     self.Liability_on_Initial_Recognition.loc[
-                        start, "CSM at Initial Recognition"] = iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP004') &
-                                (self.Assumptions['Cohort'] == start) &
-                                (self.Assumptions['BusinessType'] == 'NB') &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_CSM'])
+                        start, "CSM at Initial Recognition"] = assumption(
+                            'MAP004', start, 'Gross_CSM', 'NB')
                     self.Liability_on_Initial_Recognition.loc[
                         start,
-                        "LIABILITY ON INITIAL RECOGNITION-BE"] = iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP004') &
-                                (self.Assumptions['Cohort'] == start) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_LossC_BE'])
+                        "LIABILITY ON INITIAL RECOGNITION-BE"] = assumption(
+                            'MAP004', start, 'Gross_LossC_BE', 'NB')
                     self.Liability_on_Initial_Recognition.loc[
                         start,
-                        "LIABILITY ON INITIAL RECOGNITION-RA"] = iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP004') &
-                                (self.Assumptions['Cohort'] == start) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_LossC_RA'])
+                        "LIABILITY ON INITIAL RECOGNITION-RA"] = assumption(
+                            'MAP004', start, 'Gross_LossC_RA', 'NB')
 
                 elif self.Parameters.loc[2, "Selection"] == "Calculation":
 
                     self.Liability_on_Initial_Recognition.loc[
                         start,
-                        "PV Premium"] = iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP003') &
-                            (self.Assumptions['Cohort'] == start) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_BECFPV'])
-                    self.Liability_on_Initial_Recognition.loc[
-                        start, "PV Claims"] = iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == start) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_BECFPV'])
+                        "PV Premium"] = assumption('MAP003', start,
+                                                   'Gross_BECFPV', 'NB')
                     self.Liability_on_Initial_Recognition.loc[
                         start,
-                        "PV Risk Adjustment"] = iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == start) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_RACFPV'])
+                        "PV Claims"] = assumption('MAP013', start,
+                                                  'Gross_BECFPV', 'NB')
                     self.Liability_on_Initial_Recognition.loc[
-                        start, "PV Acquisition Expense"] = iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP016') &
-                                (self.Assumptions['Cohort'] == start) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_BECFPV'])
+                        start, "PV Risk Adjustment"] = assumption(
+                            'MAP013', start, 'Gross_RACFPV', 'NB')
+                    self.Liability_on_Initial_Recognition.loc[
+                        start, "PV Acquisition Expense"] = assumption(
+                            'MAP016', start, 'Gross_BECFPV', 'NB')
                     Total = self.Liability_on_Initial_Recognition.loc[
                         start,
                         "PV Premium"] + self.Liability_on_Initial_Recognition.loc[
@@ -1804,43 +1443,21 @@ class GMM:
                         self.Liability_on_Initial_Recognition.loc[
                             start, "CSM at Initial Recognition"] = 0
                         self.Liability_on_Initial_Recognition.loc[
-                            start,
-                            "LIABILITY ON INITIAL RECOGNITION-BE"] = (Total * (
-                                (iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP013') &
-                                    (self.Assumptions['Cohort'] == start) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_BECFPV'])) /
-                                (iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP013') &
-                                    (self.Assumptions['Cohort'] == start) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_BECFPV']) +
-                                 iferror(self.Assumptions.loc[
-                                     (self.Assumptions['Key'] == 'MAP013') &
-                                     (self.Assumptions['Cohort'] == start)
-                                     &
-                                     (self.Assumptions['BusinessType'] == 'NB'
-                                      ), 'Gross_RACFPV']))))
+                            start, "LIABILITY ON INITIAL RECOGNITION-BE"] = (
+                                Total * ((assumption('MAP013', start,
+                                                     'Gross_BECFPV', 'NB')) /
+                                         (assumption('MAP013', start,
+                                                     'Gross_BECFPV', 'NB') +
+                                          assumption('MAP013', start,
+                                                     'Gross_RACFPV', 'NB'))))
                         self.Liability_on_Initial_Recognition.loc[
-                            start,
-                            "LIABILITY ON INITIAL RECOGNITION-RA"] = (Total * (
-                                (iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP013') &
-                                    (self.Assumptions['Cohort'] == start) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_RACFPV'])) /
-                                (iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP013') &
-                                    (self.Assumptions['Cohort'] == start) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_BECFPV']) +
-                                 iferror(self.Assumptions.loc[
-                                     (self.Assumptions['Key'] == 'MAP013') &
-                                     (self.Assumptions['Cohort'] == start)
-                                     &
-                                     (self.Assumptions['BusinessType'] == 'NB'
-                                      ), 'Gross_RACFPV']))))
+                            start, "LIABILITY ON INITIAL RECOGNITION-RA"] = (
+                                Total * ((assumption('MAP013', start,
+                                                     'Gross_RACFPV', 'NB')) /
+                                         (assumption('MAP013', start,
+                                                     'Gross_BECFPV', 'NB') +
+                                          assumption('MAP013', start,
+                                                     'Gross_RACFPV', 'NB'))))
 
             # Analysis_by_remaining_coverage
 
@@ -1972,623 +1589,158 @@ class GMM:
                          "Total"), "Net balance at 31 December"]
 
                 self.Analysis_by_remaining_coverage.loc[(
-                        self.Analysis_by_remaining_coverage['Period'] == i
-                    ) & (
-                        self.Analysis_by_remaining_coverage['Measure'] ==
-                        "Liabilities for remaining coverage - Excluding loss component"
-                    ), "Other contracts recognised"] = -self.Liability_on_Initial_Recognition.loc[
-                        i, "CSM at Initial Recognition"] + iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP013') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_BECFPV']) + iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP013') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_RACFPV']) + iferror(
-                            self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP001') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_BE']
-                        ) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP001') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_RA']) - iferror(
-                                self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP001') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_CSM']
-                            ) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP005') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_BE']) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP005') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_RA']) - iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP005') &
-                                            (self.Assumptions['Cohort'] == i) &
-                                            (self.Assumptions['BusinessType']
-                                             == 'NB'), 'Gross_CSM']
-                                    ) + iferror(self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP006') &
-                                        (self.Assumptions['Cohort'] == i) &
-                                        (self.Assumptions['BusinessType'] ==
-                                         'NB'), 'Gross_BE']) + iferror(
-                                             self.Assumptions.loc[
-                                                 (self.Assumptions['Key'] ==
-                                                  'MAP006') &
-                                                 (self.Assumptions['Cohort'] ==
-                                                  i) &
-                                                 (self.
-                                                  Assumptions['BusinessType']
-                                                  == 'NB'), 'Gross_RA']
-                                         ) - iferror(self.Assumptions.loc[
-                                             (self.Assumptions['Key'] ==
-                                              'MAP006') &
-                                             (self.Assumptions['Cohort'] == i)
-                                             &
-                                             (self.Assumptions['BusinessType']
-                                              == 'NB'),
-                                             'Gross_CSM']) + iferror(
-                                                 self.Assumptions.loc[
-                                                     (self.Assumptions['Key']
-                                                      == 'MAP008') &
-                                                     (self.
-                                                      Assumptions['Cohort'] ==
-                                                      i) & (self.Assumptions[
-                                                          'BusinessType'] ==
-                                                            'NB'), 'Gross_BE']
-                                             ) + iferror(self.Assumptions.loc[
-                                                 (self.Assumptions['Key'] ==
-                                                  'MAP008') &
-                                                 (self.Assumptions['Cohort'] ==
-                                                  i) & (self.Assumptions[
-                                                      'BusinessType'] == 'NB'),
-                                                 'Gross_RA']) - iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP008') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_CSM']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP009') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP009') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_RA']
-                                                 ) - iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP009') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_CSM']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP011') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP011') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_RA']
-                                                 ) - iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP011') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_CSM']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_RA']
-                                                 ) - iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'), 'Gross_CSM'])
-                    
+                    self.Analysis_by_remaining_coverage['Period'] == i
+                ) & (
+                    self.Analysis_by_remaining_coverage['Measure'] ==
+                    "Liabilities for remaining coverage - Excluding loss component"
+                ), "Other contracts recognised"] = -self.Liability_on_Initial_Recognition.loc[
+                    i, "CSM at Initial Recognition"] + assumption(
+                        'MAP013', i, 'Gross_BECFPV', 'NB'
+                    ) + assumption(
+                        'MAP013', i, 'Gross_RACFPV', 'NB'
+                    ) + assumption('MAP001', i, 'Gross_BE', 'NB') + assumption(
+                        'MAP001', i, 'Gross_RA', 'NB'
+                    ) - assumption(
+                        'MAP001', i, 'Gross_CSM', 'NB'
+                    ) + assumption('MAP005', i, 'Gross_BE', 'NB') + assumption(
+                        'MAP005', i, 'Gross_RA', 'NB'
+                    ) - assumption(
+                        'MAP005', i, 'Gross_CSM', 'NB'
+                    ) + assumption(
+                        'MAP006', i, 'Gross_BE', 'NB'
+                    ) + assumption(
+                        'MAP006', i, 'Gross_RA', 'NB'
+                    ) - assumption(
+                        'MAP006', i, 'Gross_CSM',
+                        'NB'
+                    ) + assumption('MAP008', i, 'Gross_BE', 'NB') + assumption(
+                        'MAP008', i, 'Gross_RA', 'NB') - assumption(
+                            'MAP008', i, 'Gross_CSM', 'NB') + assumption(
+                                'MAP009', i, 'Gross_BE', 'NB') + assumption(
+                                    'MAP009', i, 'Gross_RA',
+                                    'NB') - assumption(
+                                        'MAP009', i, 'Gross_CSM',
+                                        'NB') + assumption(
+                                            'MAP011', i, 'Gross_BE',
+                                            'NB') + assumption(
+                                                'MAP011', i, 'Gross_RA', 'NB'
+                                            ) - assumption(
+                                                'MAP011', i, 'Gross_CSM',
+                                                'NB') + assumption(
+                                                    'MAP014', i, 'Gross_BE',
+                                                    'NB') + assumption(
+                                                        'MAP014', i,
+                                                        'Gross_RA',
+                                                        'NB') - assumption(
+                                                            'MAP014', i,
+                                                            'Gross_CSM', 'NB')
+
                 self.Analysis_by_remaining_coverage.loc[(
-                        self.Analysis_by_remaining_coverage['Period'] == i
-                    ) & (
-                        self.Analysis_by_remaining_coverage['Measure'] ==
-                        "Liabilities for remaining coverage - Only Loss Component"
-                    ), "Other contracts recognised"] = self.Liability_on_Initial_Recognition.loc[
-                        i,
-                        "LIABILITY ON INITIAL RECOGNITION-BE"] + self.Liability_on_Initial_Recognition.loc[
-                            i,
-                            "LIABILITY ON INITIAL RECOGNITION-RA"] + iferror(
-                                self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP001') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_LossC_BE']
-                            ) + iferror(
-                                self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP001') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_LossC_RA']
-                            ) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP005') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_LossC_BE']) + iferror(
-                                    self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP005') &
-                                        (self.Assumptions['Cohort'] == i) &
-                                        (self.Assumptions['BusinessType'] ==
-                                         'NB'), 'Gross_LossC_RA']
-                                ) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP006') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_LossC_BE']) + iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP006') &
-                                            (self.Assumptions['Cohort'] == i) &
-                                            (self.Assumptions['BusinessType']
-                                             == 'NB'), 'Gross_LossC_RA']
-                                    ) + iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP008') &
-                                            (self.Assumptions['Cohort'] == i) &
-                                            (self.Assumptions['BusinessType']
-                                             == 'NB'), 'Gross_LossC_BE']
-                                    ) + iferror(self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP008') &
-                                        (self.Assumptions['Cohort'] == i) &
-                                        (self.Assumptions['BusinessType'] ==
-                                         'NB'), 'Gross_LossC_RA']) + iferror(
-                                             self.Assumptions.loc[
-                                                 (self.Assumptions['Key'] ==
-                                                  'MAP009') &
-                                                 (self.Assumptions['Cohort'] ==
-                                                  i) &
-                                                 (self.
-                                                  Assumptions['BusinessType']
-                                                  == 'NB'), 'Gross_LossC_BE']
-                                         ) + iferror(self.Assumptions.loc[
-                                             (self.Assumptions['Key'] ==
-                                              'MAP009') &
-                                             (self.Assumptions['Cohort'] == i)
-                                             &
-                                             (self.Assumptions['BusinessType']
-                                              == 'NB'),
-                                             'Gross_LossC_RA']) + iferror(
-                                                 self.Assumptions.loc[
-                                                     (self.Assumptions['Key']
-                                                      == 'MAP011') &
-                                                     (self.
-                                                      Assumptions['Cohort'] ==
-                                                      i) &
-                                                     (self.Assumptions[
-                                                         'BusinessType'] ==
-                                                      'NB'), 'Gross_LossC_BE']
-                                             ) + iferror(self.Assumptions.loc[
-                                                 (self.Assumptions['Key'] ==
-                                                  'MAP011') &
-                                                 (self.Assumptions['Cohort'] ==
-                                                  i) & (self.Assumptions[
-                                                      'BusinessType'] == 'NB'),
-                                                 'Gross_LossC_RA']) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'),
-                                                         'Gross_LossC_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'NB'),
-                                                         'Gross_LossC_RA'])
+                    self.Analysis_by_remaining_coverage['Period'] == i
+                ) & (
+                    self.Analysis_by_remaining_coverage['Measure'] ==
+                    "Liabilities for remaining coverage - Only Loss Component"
+                ), "Other contracts recognised"] = self.Liability_on_Initial_Recognition.loc[
+                    i,
+                    "LIABILITY ON INITIAL RECOGNITION-BE"] + self.Liability_on_Initial_Recognition.loc[
+                        i, "LIABILITY ON INITIAL RECOGNITION-RA"] + assumption(
+                            'MAP001', i, 'Gross_LossC_BE', 'NB'
+                        ) + assumption(
+                            'MAP001', i, 'Gross_LossC_RA', 'NB') + assumption(
+                                'MAP005', i,
+                                'Gross_LossC_BE', 'NB') + assumption(
+                                    'MAP005', i,
+                                    'Gross_LossC_RA', 'NB') + assumption(
+                                        'MAP006', i, 'Gross_LossC_BE',
+                                        'NB') + assumption(
+                                            'MAP006', i, 'Gross_LossC_RA', 'NB'
+                                        ) + assumption(
+                                            'MAP008', i, 'Gross_LossC_BE', 'NB'
+                                        ) + assumption(
+                                            'MAP008', i, 'Gross_LossC_RA', 'NB'
+                                        ) + assumption(
+                                            'MAP009', i, 'Gross_LossC_BE', 'NB'
+                                        ) + assumption(
+                                            'MAP009', i, 'Gross_LossC_RA', 'NB'
+                                        ) + assumption(
+                                            'MAP011', i, 'Gross_LossC_BE',
+                                            'NB') + assumption(
+                                                'MAP011', i, 'Gross_LossC_RA',
+                                                'NB') + assumption(
+                                                    'MAP014', i,
+                                                    'Gross_LossC_BE',
+                                                    'NB') + assumption(
+                                                        'MAP014', i,
+                                                        'Gross_LossC_RA', 'NB')
                 self.Analysis_by_remaining_coverage.loc[
-                        (self.Analysis_by_remaining_coverage['Period'] == i) &
-                        (self.Analysis_by_remaining_coverage['Measure'] ==
-                         "Liabilities for incurred claims"),
-                        "Other contracts recognised"] = iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP001') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'IF'),
-                            'Gross_BE']) + iferror(
-                                self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP001') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'IF'),
-                                    'Gross_RA']
-                            ) - iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP001') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'IF'),
-                                'Gross_CSM']) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP005') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'IF'),
-                                    'Gross_BE']) + iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP005') &
-                                            (self.Assumptions['Cohort'] == i) &
-                                            (self.Assumptions['BusinessType']
-                                             == 'IF'), 'Gross_RA']
-                                    ) - iferror(self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP005') &
-                                        (self.Assumptions['Cohort'] == i) &
-                                        (self.Assumptions['BusinessType'] ==
-                                         'IF'), 'Gross_CSM']) + iferror(
-                                             self.Assumptions.loc[
-                                                 (self.Assumptions['Key'] ==
-                                                  'MAP006') &
-                                                 (self.Assumptions['Cohort'] ==
-                                                  i) &
-                                                 (self.
-                                                  Assumptions['BusinessType']
-                                                  == 'IF'), 'Gross_BE']
-                                         ) + iferror(
-                                             self.Assumptions.loc[
-                                                 (self.Assumptions['Key'] ==
-                                                  'MAP006') &
-                                                 (self.Assumptions['Cohort'] ==
-                                                  i) & (self.Assumptions[
-                                                      'BusinessType'] ==
-                                                        'IF'), 'Gross_RA']
-                                         ) - iferror(self.Assumptions.loc[
-                                             (self.Assumptions['Key'] ==
-                                              'MAP006'
-                                              ) &
-                                             (self.Assumptions['Cohort'] == i)
-                                             &
-                                             (self.Assumptions['BusinessType']
-                                              == 'IF'),
-                                             'Gross_CSM']) + iferror(
-                                                 self.Assumptions.loc[
-                                                     (self.Assumptions['Key']
-                                                      == 'MAP008') &
-                                                     (self.Assumptions[
-                                                         'Cohort'] == i) & (
-                                                             self.Assumptions[
-                                                                 'BusinessType']
-                                                             ==
-                                                             'IF'), 'Gross_BE']
-                                             ) + iferror(self.Assumptions.loc[
-                                                 (self.Assumptions['Key'] ==
-                                                  'MAP008')
-                                                 &
-                                                 (self.Assumptions['Cohort'] ==
-                                                  i) & (self.Assumptions[
-                                                      'BusinessType'] == 'IF'),
-                                                 'Gross_RA']) - iferror(
-                                                     self.Assumptions.
-                                                     loc[(self.Assumptions[
-                                                         'Key'] == 'MAP008') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_CSM']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP009') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP009') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_RA']
-                                                 ) - iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP009') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_CSM']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP011') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP011') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_RA']
-                                                 ) - iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP011') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_CSM']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_RA']
-                                                 ) - iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'), 'Gross_CSM']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP001') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP001') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_RA']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP005') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP005') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_RA']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP006') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP006') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_RA']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP008') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP008') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_RA']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP009') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP009') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_RA']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP011') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP011') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_RA']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_BE']
-                                                 ) + iferror(
-                                                     self.Assumptions.loc[
-                                                         (self.
-                                                          Assumptions['Key'] ==
-                                                          'MAP014') &
-                                                         (self.Assumptions[
-                                                             'Cohort'] == i) &
-                                                         (self.Assumptions[
-                                                             'BusinessType'] ==
-                                                          'IF'),
-                                                         'Gross_LossC_RA'])    
+                    (self.Analysis_by_remaining_coverage['Period'] == i) &
+                    (self.Analysis_by_remaining_coverage['Measure'] ==
+                     "Liabilities for incurred claims"),
+                    "Other contracts recognised"] = assumption(
+                        'MAP001', i, 'Gross_BE', 'IF'
+                    ) + assumption('MAP001', i, 'Gross_RA', 'IF') - assumption(
+                        'MAP001', i, 'Gross_CSM', 'IF'
+                    ) + assumption('MAP005', i, 'Gross_BE', 'IF') + assumption(
+                        'MAP005', i, 'Gross_RA', 'IF') - assumption(
+                            'MAP005', i, 'Gross_CSM', 'IF') + assumption(
+                                'MAP006', i, 'Gross_BE', 'IF') + assumption(
+                                    'MAP006', i,
+                                    'Gross_RA', 'IF') - assumption(
+                                        'MAP006', i, 'Gross_CSM',
+                                        'IF') + assumption(
+                                            'MAP008', i, 'Gross_BE', 'IF'
+                                        ) + assumption(
+                                            'MAP008', i, 'Gross_RA', 'IF'
+                                        ) - assumption(
+                                            'MAP008', i, 'Gross_CSM', 'IF'
+                                        ) + assumption(
+                                            'MAP009', i, 'Gross_BE', 'IF'
+                                        ) + assumption(
+                                            'MAP009', i, 'Gross_RA', 'IF'
+                                        ) - assumption(
+                                            'MAP009', i, 'Gross_CSM', 'IF'
+                                        ) + assumption(
+                                            'MAP011', i, 'Gross_BE', 'IF'
+                                        ) + assumption(
+                                            'MAP011', i, 'Gross_RA', 'IF'
+                                        ) - assumption(
+                                            'MAP011', i, 'Gross_CSM', 'IF'
+                                        ) + assumption(
+                                            'MAP014', i, 'Gross_BE', 'IF'
+                                        ) + assumption(
+                                            'MAP014', i, 'Gross_RA', 'IF'
+                                        ) - assumption(
+                                            'MAP014', i, 'Gross_CSM', 'IF'
+                                        ) + assumption(
+                                            'MAP001', i, 'Gross_LossC_BE', 'IF'
+                                        ) + assumption(
+                                            'MAP001', i, 'Gross_LossC_RA', 'IF'
+                                        ) + assumption(
+                                            'MAP005', i, 'Gross_LossC_BE', 'IF'
+                                        ) + assumption(
+                                            'MAP005', i, 'Gross_LossC_RA', 'IF'
+                                        ) + assumption(
+                                            'MAP006', i, 'Gross_LossC_BE', 'IF'
+                                        ) + assumption(
+                                            'MAP006', i, 'Gross_LossC_RA', 'IF'
+                                        ) + assumption(
+                                            'MAP008', i, 'Gross_LossC_BE', 'IF'
+                                        ) + assumption(
+                                            'MAP008', i, 'Gross_LossC_RA', 'IF'
+                                        ) + assumption(
+                                            'MAP009', i, 'Gross_LossC_BE', 'IF'
+                                        ) + assumption(
+                                            'MAP009', i, 'Gross_LossC_RA', 'IF'
+                                        ) + assumption(
+                                            'MAP011', i, 'Gross_LossC_BE',
+                                            'IF') + assumption(
+                                                'MAP011', i, 'Gross_LossC_RA',
+                                                'IF') + assumption(
+                                                    'MAP014', i,
+                                                    'Gross_LossC_BE',
+                                                    'IF') + assumption(
+                                                        'MAP014', i,
+                                                        'Gross_LossC_RA', 'IF')
                 self.Analysis_by_remaining_coverage.loc[(
                         self.Analysis_by_remaining_coverage['Period'] == i
                     ) & (
@@ -2611,72 +1763,36 @@ class GMM:
                             (self.Analysis_by_remaining_coverage['Measure'] ==
                              "Liabilities for incurred claims"),
                             "Other contracts recognised"]
-    
+
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
-                    ) & (
-                        self.Analysis_by_remaining_coverage['Measure'] ==
-                        "Liabilities for remaining coverage - Excluding loss component"
-                    ), "Expected incurred claims and other insurance services expenses"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'), 'Gross_BE']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_RA']) - (iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_CSM'])) 
+                ) & (
+                    self.Analysis_by_remaining_coverage['Measure'] ==
+                    "Liabilities for remaining coverage - Excluding loss component"
+                ), "Expected incurred claims and other insurance services expenses"] = assumption(
+                    'MAP013', i, 'Gross_BE', 'NB') + assumption(
+                        'MAP013', i, 'Gross_RA', 'NB') - (assumption(
+                            'MAP013', i, 'Gross_CSM', 'NB'))
                 self.Analysis_by_remaining_coverage.loc[(
-                        self.Analysis_by_remaining_coverage['Period'] == i
-                    ) & (
-                        self.Analysis_by_remaining_coverage['Measure'] ==
-                        "Liabilities for remaining coverage - Only Loss component"
-                    ), "Expected incurred claims and other insurance services expenses"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_LossC_BE']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_LossC_RA']) 
+                    self.Analysis_by_remaining_coverage['Period'] == i
+                ) & (
+                    self.Analysis_by_remaining_coverage['Measure'] ==
+                    "Liabilities for remaining coverage - Only Loss Component"
+                ), "Expected incurred claims and other insurance services expenses"] = assumption(
+                    'MAP013', i, 'Gross_LossC_BE', 'NB') + assumption(
+                        'MAP013', i, 'Gross_LossC_RA', 'NB')
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
-                    ) & (
-                        self.Analysis_by_remaining_coverage['Measure'] ==
-                        "Liabilities for incurred claims"
-                    ), "Expected incurred claims and other insurance services expenses"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'IF'), 'Gross_BE']
-                    ) + iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP013') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'IF'), 'Gross_RA']
-                    ) - iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP013') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'IF'),
-                        'Gross_CSM']) +  iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] == 'MAP013') &
-                                            (self.Assumptions['Cohort'] == i) &
-                                            (self.Assumptions['BusinessType'] ==
-                                            'IF'), 'Gross_LossC_BE']
-                                    ) + iferror(self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP013') &
-                                        (self.Assumptions['Cohort'] == i) &
-                                        (self.Assumptions['BusinessType'] == 'IF'),
-                                        'Gross_LossC_RA']) 
+                ) & (
+                    self.Analysis_by_remaining_coverage['Measure'] ==
+                    "Liabilities for incurred claims"
+                ), "Expected incurred claims and other insurance services expenses"] = assumption(
+                    'MAP013', i, 'Gross_BE', 'IF') + assumption(
+                        'MAP013', i, 'Gross_RA', 'IF') - assumption(
+                            'MAP013', i, 'Gross_CSM', 'IF') + assumption(
+                                'MAP013', i,
+                                'Gross_LossC_BE', 'IF') + assumption(
+                                    'MAP013', i, 'Gross_LossC_RA', 'IF')
                 self.Analysis_by_remaining_coverage.loc[(
                         self.Analysis_by_remaining_coverage['Period'] == i
                     ) & (
@@ -2705,62 +1821,30 @@ class GMM:
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
                     "Liabilities for remaining coverage - Excluding loss component"
-                ), "Losses and reversals of losses on onerous contracts"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP018') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_BE']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP018') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_RA']) - iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP018') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_CSM'])
+                ), "Losses and reversals of losses on onerous contracts"] = assumption(
+                    'MAP018', i, 'Gross_BE', 'NB') + assumption(
+                        'MAP018', i, 'Gross_RA', 'NB') - assumption(
+                            'MAP018', i, 'Gross_CSM', 'NB')
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for remaining coverage - Only Loss component"
-                ), "Losses and reversals of losses on onerous contracts"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP018') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP018') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_LossC_RA'])
+                    "Liabilities for remaining coverage - Only Loss Component"
+                ), "Losses and reversals of losses on onerous contracts"] = assumption(
+                    'MAP018', i, 'Gross_LossC_BE', 'NB') + assumption(
+                        'MAP018', i, 'Gross_LossC_RA', 'NB')
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
                     "Liabilities for incurred claims"
-                ), "Losses and reversals of losses on onerous contracts"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP018') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'IF'), 'Gross_BE']
-                ) + iferror(self.Assumptions.loc[
-                    (self.Assumptions['Key'] == 'MAP018') &
-                    (self.Assumptions['Cohort'] == i) &
-                    (self.Assumptions['BusinessType'] == 'IF'),
-                    'Gross_RA']) - iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP018') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'IF'),
-                        'Gross_CSM']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP018') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'IF'),
-                            'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP018') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'IF'),
-                                'Gross_LossC_RA'])
+                ), "Losses and reversals of losses on onerous contracts"] = assumption(
+                    'MAP018', i, 'Gross_BE', 'IF') + assumption(
+                        'MAP018', i, 'Gross_RA', 'IF') - assumption(
+                            'MAP018', i, 'Gross_CSM', 'IF') + assumption(
+                                'MAP018', i,
+                                'Gross_LossC_BE', 'IF') + assumption(
+                                    'MAP018', i, 'Gross_LossC_RA', 'IF')
                 self.Analysis_by_remaining_coverage.loc[(
                         self.Analysis_by_remaining_coverage['Period'] == i
                     ) & (
@@ -2784,68 +1868,36 @@ class GMM:
                              "Liabilities for incurred claims"),
                             "Losses and reversals of losses on onerous contracts"]
 
-    
+
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
                     "Liabilities for remaining coverage - Excluding loss component"
-                ), "Adjustments to liabilities for incurred claims"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP017') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_BE']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP017') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_RA']) - iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP017') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_CSM'])
+                ), "Adjustments to liabilities for incurred claims"] = assumption(
+                    'MAP017', i, 'Gross_BE', 'NB') + assumption(
+                        'MAP017', i, 'Gross_RA', 'NB') - assumption(
+                            'MAP017', i, 'Gross_CSM', 'NB')
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for remaining coverage - Only Loss component"
-                ), "Adjustments to liabilities for incurred claims"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP017') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP017') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_LossC_RA'])
+                    "Liabilities for remaining coverage - Only Loss Component"
+                ), "Adjustments to liabilities for incurred claims"] = assumption(
+                    'MAP017', i, 'Gross_LossC_BE', 'NB') + assumption(
+                        'MAP017', i, 'Gross_LossC_RA', 'NB')
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
                     "Liabilities for incurred claims"
-                ), "Adjustments to liabilities for incurred claims"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP017') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'IF'), 'Gross_BE']
-                ) + iferror(self.Assumptions.loc[
-                    (self.Assumptions['Key'] == 'MAP017') &
-                    (self.Assumptions['Cohort'] == i) &
-                    (self.Assumptions['BusinessType'] == 'IF'),
-                    'Gross_RA']) - iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP017') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'IF'),
-                        'Gross_CSM']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP017') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'IF'),
-                            'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP017') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'IF'),
-                                'Gross_LossC_RA'])
+                ), "Adjustments to liabilities for incurred claims"] = assumption(
+                    'MAP017', i, 'Gross_BE', 'IF') + assumption(
+                        'MAP017', i, 'Gross_RA', 'IF') - assumption(
+                            'MAP017', i, 'Gross_CSM', 'IF') + assumption(
+                                'MAP017', i,
+                                'Gross_LossC_BE', 'IF') + assumption(
+                                    'MAP017', i, 'Gross_LossC_RA', 'IF')
                 self.Analysis_by_remaining_coverage.loc[(
                         self.Analysis_by_remaining_coverage['Period'] == i
                     ) & (
@@ -2905,17 +1957,17 @@ class GMM:
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for remaining coverage - Only Loss component"
+                    "Liabilities for remaining coverage - Only Loss Component"
                 ), "Insurance service result"] = self.Analysis_by_remaining_coverage.loc[
                         (self.Analysis_by_remaining_coverage['Period'] == i) &
                         (self.Analysis_by_remaining_coverage['Measure'] ==
-                         "Liabilities for remaining coverage - Only Loss component"
+                         "Liabilities for remaining coverage - Only Loss Component"
                          ),
                         "Other contracts recognised"] + self.Analysis_by_remaining_coverage.loc[
                             (self.Analysis_by_remaining_coverage['Period'] == i
                              ) &
                             (self.Analysis_by_remaining_coverage['Measure'] ==
-                             "Liabilities for remaining coverage - Only Loss component"
+                             "Liabilities for remaining coverage - Only Loss Component"
                              ),
                             "Expected incurred claims and other insurance services expenses"] + self.Analysis_by_remaining_coverage.loc[
                                 (self.
@@ -2923,14 +1975,14 @@ class GMM:
                                 &
                                 (self.
                                  Analysis_by_remaining_coverage['Measure'] ==
-                                 "Liabilities for remaining coverage - Only Loss component"
+                                 "Liabilities for remaining coverage - Only Loss Component"
                                  ),
                                 "Losses and reversals of losses on onerous contracts"] + self.Analysis_by_remaining_coverage.loc[
                                     (self.Analysis_by_remaining_coverage[
                                         'Period'] == i) &
                                     (self.Analysis_by_remaining_coverage[
                                         'Measure'] ==
-                                     "Liabilities for remaining coverage - Only Loss component"
+                                     "Liabilities for remaining coverage - Only Loss Component"
                                      ),
                                     "Adjustments to liabilities for incurred claims"]
                 self.Analysis_by_remaining_coverage.loc[(
@@ -2988,114 +2040,44 @@ class GMM:
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
                     "Liabilities for remaining coverage - Excluding loss component"
-                ), "Net finance expenses from insurance contracts"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP007') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'), 'Gross_BE']
-                ) + iferror(self.Assumptions.loc[
-                    (self.Assumptions['Key'] == 'MAP007') &
-                    (self.Assumptions['Cohort'] == i) &
-                    (self.Assumptions['BusinessType'] == 'NB'),
-                    'Gross_RA']) - iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP007') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_CSM']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP010') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP010') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_RA']) - iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP010') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'NB'),
-                                    'Gross_CSM'])
-                self.Analysis_by_remaining_coverage.loc[
-                    (self.Analysis_by_remaining_coverage['Period'] == i) &
-                    (self.Analysis_by_remaining_coverage['Measure'] ==
-                     "Liabilities for remaining coverage - Only Loss component"
-                     ),
-                    "Net finance expenses from insurance contracts"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP007') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_LossC_BE']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP007') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_LossC_RA']) + iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP010') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'NB'),
-                            'Gross_LossC_BE']) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP010') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'NB'),
-                                'Gross_LossC_RA'])
-                self.Analysis_by_remaining_coverage.loc[
-                    (self.Analysis_by_remaining_coverage['Period'] == i) &
-                    (self.Analysis_by_remaining_coverage['Measure'] ==
-                     "Liabilities for incurred claims"),
-                    "Net finance expenses from insurance contracts"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP007') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'IF'),
-                            'Gross_BE']
-                    ) + iferror(self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP007') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'IF'),
-                        'Gross_RA']) - iferror(self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP007') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'IF'),
-                            'Gross_CSM']) + iferror(
-                                self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP007') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'IF'),
-                                    'Gross_LossC_BE']
-                            ) + iferror(self.Assumptions.loc[
-                                (self.Assumptions['Key'] == 'MAP007') &
-                                (self.Assumptions['Cohort'] == i) &
-                                (self.Assumptions['BusinessType'] == 'IF'),
-                                'Gross_LossC_RA']) + iferror(
-                                    self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP010') &
-                                        (self.Assumptions['Cohort'] == i) &
-                                        (self.Assumptions['BusinessType'] ==
-                                         'IF'), 'Gross_BE']
-                                ) + iferror(self.Assumptions.loc[
-                                    (self.Assumptions['Key'] == 'MAP010') &
-                                    (self.Assumptions['Cohort'] == i) &
-                                    (self.Assumptions['BusinessType'] == 'IF'),
-                                    'Gross_RA']) - iferror(
-                                        self.Assumptions.loc[
-                                            (self.Assumptions['Key'] ==
-                                             'MAP010') &
-                                            (self.Assumptions['Cohort'] == i) &
-                                            (self.Assumptions['BusinessType']
-                                             == 'IF'), 'Gross_CSM']
-                                    ) + iferror(self.Assumptions.loc[
-                                        (self.Assumptions['Key'] == 'MAP010') &
-                                        (self.Assumptions['Cohort'] == i) &
-                                        (self.Assumptions['BusinessType'] ==
-                                         'IF'), 'Gross_LossC_BE']) + iferror(
-                                             self.Assumptions.loc[
-                                                 (self.Assumptions['Key'] ==
-                                                  'MAP010') &
-                                                 (self.Assumptions['Cohort'] ==
-                                                  i) &
-                                                 (self.
-                                                  Assumptions['BusinessType']
-                                                  == 'IF'), 'Gross_LossC_RA'])
+                ), "Net finance expenses from insurance contracts"] = assumption(
+                    'MAP007', i, 'Gross_BE', 'NB') + assumption(
+                        'MAP007', i, 'Gross_RA', 'NB') - assumption(
+                            'MAP007', i, 'Gross_CSM', 'NB') + assumption(
+                                'MAP010', i, 'Gross_BE', 'NB') + assumption(
+                                    'MAP010', i,
+                                    'Gross_RA', 'NB') - assumption(
+                                        'MAP010', i, 'Gross_CSM', 'NB')
+                self.Analysis_by_remaining_coverage.loc[(
+                    self.Analysis_by_remaining_coverage['Period'] == i
+                ) & (
+                    self.Analysis_by_remaining_coverage['Measure'] ==
+                    "Liabilities for remaining coverage - Only Loss Component"
+                ), "Net finance expenses from insurance contracts"] = assumption(
+                    'MAP007', i, 'Gross_LossC_BE', 'NB') + assumption(
+                        'MAP007', i, 'Gross_LossC_RA', 'NB') + assumption(
+                            'MAP010', i, 'Gross_LossC_BE', 'NB') + assumption(
+                                'MAP010', i, 'Gross_LossC_RA', 'NB')
+                self.Analysis_by_remaining_coverage.loc[(
+                    self.Analysis_by_remaining_coverage['Period'] == i
+                ) & (
+                    self.Analysis_by_remaining_coverage['Measure'] ==
+                    "Liabilities for incurred claims"
+                ), "Net finance expenses from insurance contracts"] = assumption(
+                    'MAP007', i, 'Gross_BE', 'IF'
+                ) + assumption('MAP007', i, 'Gross_RA', 'IF') - assumption(
+                    'MAP007', i, 'Gross_CSM', 'IF') + assumption(
+                        'MAP007', i, 'Gross_LossC_BE', 'IF') + assumption(
+                            'MAP007', i, 'Gross_LossC_RA', 'IF') + assumption(
+                                'MAP010', i, 'Gross_BE', 'IF') + assumption(
+                                    'MAP010', i,
+                                    'Gross_RA', 'IF') - assumption(
+                                        'MAP010', i, 'Gross_CSM',
+                                        'IF') + assumption(
+                                            'MAP010', i, 'Gross_LossC_BE',
+                                            'IF') + assumption(
+                                                'MAP010', i, 'Gross_LossC_RA',
+                                                'IF')
                 self.Analysis_by_remaining_coverage.loc[(
                         self.Analysis_by_remaining_coverage['Period'] == i
                     ) & (
@@ -3138,16 +2120,16 @@ class GMM:
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for remaining coverage - Only Loss component"
+                    "Liabilities for remaining coverage - Only Loss Component"
                 ), "Investment components and premium refunds"] = self.Analysis_by_remaining_coverage.loc[
                     (self.Analysis_by_remaining_coverage['Period'] == i) &
                     (self.Analysis_by_remaining_coverage['Measure'] ==
-                     "Liabilities for remaining coverage - Only Loss component"
+                     "Liabilities for remaining coverage - Only Loss Component"
                      ),
                     "Net finance expenses from insurance contracts"] + self.Analysis_by_remaining_coverage.loc[
                         (self.Analysis_by_remaining_coverage['Period'] == i) &
                         (self.Analysis_by_remaining_coverage['Measure'] ==
-                         "Liabilities for remaining coverage - Only Loss component"
+                         "Liabilities for remaining coverage - Only Loss Component"
                          ), "Effect of movement in exchange rates"]
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
@@ -3205,16 +2187,16 @@ class GMM:
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for remaining coverage - Only Loss component"
+                    "Liabilities for remaining coverage - Only Loss Component"
                 ), "Total changes in the statement of profit and loss and OCI"] = self.Analysis_by_remaining_coverage.loc[
                     (self.Analysis_by_remaining_coverage['Period'] == i) &
                     (self.Analysis_by_remaining_coverage['Measure'] ==
-                     "Liabilities for remaining coverage - Only Loss component"
+                     "Liabilities for remaining coverage - Only Loss Component"
                      ),
                     "Insurance service result"] + self.Analysis_by_remaining_coverage.loc[
                         (self.Analysis_by_remaining_coverage['Period'] == i) &
                         (self.Analysis_by_remaining_coverage['Measure'] ==
-                         "Liabilities for remaining coverage - Only Loss component"
+                         "Liabilities for remaining coverage - Only Loss Component"
                          ), "Investment components and premium refunds"]
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
@@ -3258,11 +2240,8 @@ class GMM:
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
                     "Liabilities for remaining coverage - Excluding loss component"
-                ), "Premiums received"] = iferror(self.Assumptions.loc[
-                    (self.Assumptions['Key'] == 'MAP002') &
-                    (self.Assumptions['Cohort'] == i) &
-                    (self.Assumptions['BusinessType'] == 'NB'),
-                    'Gross_Actual'])
+                ), "Premiums received"] = assumption('MAP002', i,
+                                                     'Gross_Actual', 'NB')
                 self.Analysis_by_remaining_coverage.loc[(
                         self.Analysis_by_remaining_coverage['Period'] == i
                     ) & (
@@ -3291,23 +2270,14 @@ class GMM:
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
                     "Liabilities for remaining coverage - Excluding loss component"
-                ), "Actual claims and other expenses paid"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP012') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_Actual'])
-                self.Analysis_by_remaining_coverage.loc[(
-                    self.Analysis_by_remaining_coverage['Period'] == i
-                ) & (
-                    self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for incurred claims"
-                ), "Actual claims and other expenses paid"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP012') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'IF'),
-                        'Gross_Actual'])
+                ), "Actual claims and other expenses paid"] = assumption(
+                    'MAP012', i, 'Gross_Actual', 'NB')
+                self.Analysis_by_remaining_coverage.loc[
+                    (self.Analysis_by_remaining_coverage['Period'] == i) &
+                    (self.Analysis_by_remaining_coverage['Measure'] ==
+                     "Liabilities for incurred claims"),
+                    "Actual claims and other expenses paid"] = assumption(
+                        'MAP012', i, 'Gross_Actual', 'IF')
                 self.Analysis_by_remaining_coverage.loc[(
                         self.Analysis_by_remaining_coverage['Period'] == i
                     ) & (
@@ -3336,22 +2306,14 @@ class GMM:
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
                     "Liabilities for remaining coverage - Excluding loss component"
-                ), "Insurance acquisition cash flows"] = iferror(
-                    self.Assumptions.loc[
-                        (self.Assumptions['Key'] == 'MAP015') &
-                        (self.Assumptions['Cohort'] == i) &
-                        (self.Assumptions['BusinessType'] == 'NB'),
-                        'Gross_Actual'])
+                ), "Insurance acquisition cash flows"] = assumption(
+                    'MAP015', i, 'Gross_Actual', 'NB')
                 self.Analysis_by_remaining_coverage.loc[
                     (self.Analysis_by_remaining_coverage['Period'] == i) &
                     (self.Analysis_by_remaining_coverage['Measure'] ==
                      "Liabilities for incurred claims"),
-                    "Insurance acquisition cash flows"] = iferror(
-                        self.Assumptions.loc[
-                            (self.Assumptions['Key'] == 'MAP015') &
-                            (self.Assumptions['Cohort'] == i) &
-                            (self.Assumptions['BusinessType'] == 'IF'),
-                            'Gross_Actual'])
+                    "Insurance acquisition cash flows"] = assumption(
+                        'MAP015', i, 'Gross_Actual', 'IF')
                 self.Analysis_by_remaining_coverage.loc[(
                         self.Analysis_by_remaining_coverage['Period'] == i
                     ) & (
@@ -3399,21 +2361,21 @@ class GMM:
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for remaining coverage - Only Loss component"
+                    "Liabilities for remaining coverage - Only Loss Component"
                 ), "Total cash flows"] = self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for remaining coverage - Only Loss component"
+                    "Liabilities for remaining coverage - Only Loss Component"
                 ), "Premiums received"] + self.Analysis_by_remaining_coverage.loc[
                     (self.Analysis_by_remaining_coverage['Period'] == i) &
                     (self.Analysis_by_remaining_coverage['Measure'] ==
-                     "Liabilities for remaining coverage - Only Loss component"
+                     "Liabilities for remaining coverage - Only Loss Component"
                      ),
                     "Actual claims and other expenses paid"] + self.Analysis_by_remaining_coverage.loc[
                         (self.Analysis_by_remaining_coverage['Period'] == i) &
                         (self.Analysis_by_remaining_coverage['Measure'] ==
-                         "Liabilities for remaining coverage - Only Loss component"
+                         "Liabilities for remaining coverage - Only Loss Component"
                          ), "Insurance acquisition cash flows"]
                 self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
@@ -3489,28 +2451,28 @@ class GMM:
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for remaining coverage - Only Loss component"
+                    "Liabilities for remaining coverage - Only Loss Component"
                 ), "Net balance at 31 December"] = self.Analysis_by_remaining_coverage.loc[(
                     self.Analysis_by_remaining_coverage['Period'] == i
                 ) & (
                     self.Analysis_by_remaining_coverage['Measure'] ==
-                    "Liabilities for remaining coverage - Only Loss component"
+                    "Liabilities for remaining coverage - Only Loss Component"
                 ), "Net balance at 1 January"] + self.Analysis_by_remaining_coverage.loc[
                     (self.Analysis_by_remaining_coverage['Period'] == i)
                     &
                     (self.Analysis_by_remaining_coverage['Measure'] ==
-                     "Liabilities for remaining coverage - Only Loss component"
+                     "Liabilities for remaining coverage - Only Loss Component"
                      ),
                     "Total changes in the statement of profit and loss and OCI"] + self.Analysis_by_remaining_coverage.loc[
                         (self.Analysis_by_remaining_coverage['Period'] == i) &
                         (self.Analysis_by_remaining_coverage['Measure'] ==
-                         "Liabilities for remaining coverage - Only Loss component"
+                         "Liabilities for remaining coverage - Only Loss Component"
                          ),
                         "Total cash flows"] + self.Analysis_by_remaining_coverage.loc[
                             (self.Analysis_by_remaining_coverage['Period'] == i
                              ) &
                             (self.Analysis_by_remaining_coverage['Measure'] ==
-                             "Liabilities for remaining coverage - Only Loss component"
+                             "Liabilities for remaining coverage - Only Loss Component"
                              ),
                             "Other items transfer in the statement of financial position"]
                 self.Analysis_by_remaining_coverage.loc[(
@@ -3562,7 +2524,30 @@ class GMM:
 
 
             self.ARC.append(self.Analysis_by_remaining_coverage)
+            timer.size('ARC', self.Analysis_by_remaining_coverage,
+                       (product_name.item(), subproduct_name.item()))
 
+        timer.start('concat_arc')
         self.ARC = pd.concat(self.ARC)
-        self.ARC = self.ARC.to_csv('Analysis_by_remaining_coverage.csv')
-        df_ARC = pd.DataFrame(self.ARC)
\ No newline at end of file
+        timer.size('ARC', self.ARC)
+
+        # Reports stay in memory, a sink only writes copies of them
+        reports = {
+            'BEL': self.BEL,
+            'RA': self.RA,
+            'CSM': self.CSM,
+            'TCL': self.TCL,
+            'AMC': self.AMC,
+            'ARC': self.ARC
+        }
+        if sink is not None:
+            timer.start('write',
+                        rows=sum(len(frame.index)
+                                 for frame in reports.values()))
+        write_reports(reports, sink)
+        timer.stop()
+
+        # Wall and CPU seconds of every stage, per group inside the group
+        # loops, and with profile_memory its peak and retained bytes
+        self.Timings = timer.report()
+        self.Frame_Sizes = timer.frame_sizes()
@@ -0,0 +1,89 @@
+import pandas as pd
+
+from IFRS17.cube import GROUP, INPUT_KEYS, MEASURES, input_keys
+
+
+def reduce_assumptions(frame):
+    # Sum of the measures at the grain the models read, rows with a missing
+    # BusinessType are kept
+    return frame.groupby(input_keys(frame.columns),
+                         dropna=False)[MEASURES].sum()
+
+
+def fold_assumptions(chunks):
+    # Running sums over a sequence of assumption chunks
+    reduced = None
+    for chunk in chunks:
+        chunk = reduce_assumptions(chunk)
+        if reduced is not None:
+            chunk = pd.concat([reduced, chunk]).groupby(
+                level=list(chunk.index.names), dropna=False).sum()
+        reduced = chunk
+
+    if reduced is None:
+        return pd.DataFrame(columns=INPUT_KEYS + MEASURES)
+    return reduced.reset_index()
+
+
+def read_assumptions(path, chunksize=1000000, **kwargs):
+    """Read an assumption CSV in chunks of ``chunksize`` rows.
+
+    Only the key and measure columns are parsed and every chunk is reduced
+    to one row per Cohort, Product, Sub-Product, BusinessType, Key and,
+    when there is one, Period before the next one is read, so memory is
+    bounded by the size of that aggregate rather than by the size of the
+    file. The result can be passed to
+    ``GMM`` or ``GMMEngine`` in place of the full table.
+    """
+    return fold_assumptions(
+        pd.read_csv(path,
+                    usecols=lambda column: column in INPUT_KEYS + ['Period'] +
+                    MEASURES,
+                    chunksize=chunksize,
+                    **kwargs))
+
+
+def _dataset():
+    # pyarrow is only needed for Parquet input and output
+    try:
+        import pyarrow.dataset
+    except ImportError:
+        raise ImportError("Parquet support requires pyarrow, "
+                          "install it with 'pip install pyarrow'")
+    return pyarrow.dataset
+
+
+def read_assumptions_parquet(path, groups=None):
+    """Read an assumption table from Parquet.
+
+    ``path`` is a file or a dataset directory, such as one written by
+    ``write_assumptions_parquet``. Only the key and measure columns are
+    read, batch by batch, and reduced as in ``read_assumptions``. ``groups``
+    optionally lists the (Product, Sub-Product) pairs to read, other
+    partitions are skipped.
+    """
+    ds = _dataset()
+    dataset = ds.dataset(path, format='parquet', partitioning='hive')
+    columns = input_keys(dataset.schema.names) + MEASURES
+
+    condition = None
+    for product, subproduct in groups or []:
+        match = ((ds.field(GROUP[0]) == product) &
+                 (ds.field(GROUP[1]) == subproduct))
+        condition = match if condition is None else condition | match
+
+    return fold_assumptions(
+        batch.to_pandas() for batch in dataset.to_batches(
+            columns=columns, filter=condition))
+
+
+def write_assumptions_parquet(assumptions, path):
+    # One directory per Product/Sub-Product, holding only the columns the
+    # models read
+    _dataset()
+    assumptions[input_keys(assumptions.columns) + MEASURES].to_parquet(
+        path,
+        engine='pyarrow',
+        partition_cols=GROUP,
+        index=False,
+        existing_data_behavior='delete_matching')
@@ -0,0 +1,50 @@
+import numpy as np
+
+
+def roll_forward(change, opening=None):
+    """Opening and closing balances of a roll-forward.
+
+    ``change`` holds the net movement of each period along its last axis,
+    any leading axes (measure, group, ...) are carried along. ``opening`` is
+    the balance brought into the first period and defaults to 0. The
+    balances are derived with a single cumulative sum, so the period axis
+    is never walked one step at a time.
+    """
+    change = np.asarray(change, dtype=float)
+    if opening is None:
+        opening = np.zeros(change.shape[:-1])
+
+    closing = np.cumsum(change, axis=-1) + np.asarray(opening)[..., None]
+
+    opened = np.empty_like(closing)
+    if closing.shape[-1] > 0:
+        opened[..., 0] = opening
+        opened[..., 1:] = closing[..., :-1]
+    return opened, closing
+
+
+def amortise(change, fraction, opening=None):
+    """Opening balance, release and closing balance of an amortised balance.
+
+    Every period releases ``fraction`` of the balance before release, the
+    opening balance plus ``change``, so that
+    ``closing[t] = (opening[t] + change[t]) * (1 - fraction[t])``. The
+    period axis is last and ``opening`` defaults to 0 as in
+    ``roll_forward``. Each period depends on the one before, so the
+    periods are stepped through in order, every step updating all leading
+    axes (group, ...) at once. Memory stays at a few copies of ``change``.
+    """
+    change = np.asarray(change, dtype=float)
+    kept = 1 - np.broadcast_to(np.asarray(fraction, dtype=float),
+                               change.shape)
+    balance = np.zeros(change.shape[:-1])
+    if opening is not None:
+        balance = balance + opening
+
+    opened = np.empty_like(change)
+    closing = np.empty_like(change)
+    for t in range(change.shape[-1]):
+        opened[..., t] = balance
+        balance = (balance + change[..., t]) * kept[..., t]
+        closing[..., t] = balance
+    return opened, closing - opened - change, closing
@@ -0,0 +1,162 @@
+import pandas as pd
+import numpy as np
+
+from IFRS17.cube import KEYS, MEASURES
+
+MAPPING_COLUMNS = ['Report', 'Line', 'Key', 'Measure', 'Sign']
+
+ASSUMPTION_KEYS = [
+    'MAP001', 'MAP005', 'MAP006', 'MAP008', 'MAP009', 'MAP011', 'MAP018'
+]
+EXPENSE_KEYS = ['MAP007', 'MAP010']
+RELEASE_KEYS = ['MAP013', 'MAP014']
+PAST_SERVICE_KEYS = ['MAP017']
+ESTIMATE_KEYS = [
+    'MAP001', 'MAP005', 'MAP006', 'MAP008', 'MAP009', 'MAP011'
+]
+ONEROUS_KEYS = ['MAP018']
+RECOGNISED_KEYS = [
+    'MAP001', 'MAP005', 'MAP006', 'MAP008', 'MAP009', 'MAP011', 'MAP014'
+]
+
+BE = ['Gross_BE', 'Gross_LossC_BE']
+RA = ['Gross_RA', 'Gross_LossC_RA']
+CSM = ['Gross_CSM']
+ACTUAL = ['Gross_Actual']
+LOSS = ['Gross_LossC_BE', 'Gross_LossC_RA']
+
+
+def mapping_table(rules):
+    """Expand ``(report, line, keys, measures, sign)`` rules to one row per
+    key and measure."""
+    return pd.DataFrame([(report, line, key, measure, sign)
+                         for report, line, keys, measures, sign in rules
+                         for key in keys for measure in measures],
+                        columns=MAPPING_COLUMNS)
+
+
+# Movement lines that are a signed sum of MAP keys. AMC-PV, AMC-RA and
+# AMC-CSM are the measures of the analysis by measurement component, ARC-LRC,
+# ARC-LC and ARC-LIC those of the analysis by remaining coverage. New
+# Business is derived from initial recognition and is not listed here.
+DEFAULT_MAPPING = mapping_table([
+    ('BEL', "Changes Related to Future Service: Assumptions", ASSUMPTION_KEYS,
+     BE, 1),
+    ('BEL', "Insurance Service Expense", EXPENSE_KEYS, BE, 1),
+    ('BEL', "Changes Related to Current Service: Release", RELEASE_KEYS, BE, 1),
+    ('BEL', "Changes Related to Past Service", PAST_SERVICE_KEYS, BE, 1),
+    ('RA', "Changes Related to Future Service: Assumptions", ASSUMPTION_KEYS,
+     RA, 1),
+    ('RA', "Insurance Service Expense", EXPENSE_KEYS, RA, 1),
+    ('RA', "Changes Related to Current Service: Release", RELEASE_KEYS, RA, 1),
+    ('RA', "Changes Related to Past Service", PAST_SERVICE_KEYS, RA, 1),
+    ('CSM', "Changes Related to Future Service: Assumptions", ASSUMPTION_KEYS,
+     CSM, -1),
+    ('CSM', "Insurance Service Expense", EXPENSE_KEYS, CSM, -1),
+    ('CSM', "Changes Related to Current Service: Release", RELEASE_KEYS, CSM,
+     -1),
+    ('CSM', "Changes Related to Past Service", PAST_SERVICE_KEYS, CSM, -1),
+    ('AMC-PV', 'Experience adjustments', RELEASE_KEYS, BE, 1),
+    ('AMC-RA', 'Risk Adjustment recognised for the risk expired',
+     RELEASE_KEYS, RA, 1),
+    ('AMC-CSM', 'CSM recognised in profit or loss for the services provided',
+     RELEASE_KEYS, CSM, -1),
+    ('AMC-PV', 'Changes in estimates that adjust the CSM', ESTIMATE_KEYS, BE,
+     1),
+    ('AMC-RA', 'Changes in estimates that adjust the CSM', ESTIMATE_KEYS, RA,
+     1),
+    ('AMC-CSM', 'Changes in estimates that adjust the CSM', ESTIMATE_KEYS,
+     CSM, -1),
+    ('AMC-PV', 'Changes in onerous contract losses or reversal of losses',
+     ONEROUS_KEYS, BE, 1),
+    ('AMC-RA', 'Changes in onerous contract losses or reversal of losses',
+     ONEROUS_KEYS, RA, 1),
+    ('AMC-CSM', 'Changes in onerous contract losses or reversal of losses',
+     ONEROUS_KEYS, CSM, 1),
+    ('AMC-PV', 'Adjustments to liabilities for incurred claims',
+     PAST_SERVICE_KEYS, BE, 1),
+    ('AMC-RA', 'Adjustments to liabilities for incurred claims',
+     PAST_SERVICE_KEYS, RA, 1),
+    ('AMC-CSM', 'Adjustments to liabilities for incurred claims',
+     PAST_SERVICE_KEYS, CSM, -1),
+    ('AMC-PV', 'Finance expenses from insurance contracts issued',
+     EXPENSE_KEYS, BE, 1),
+    ('AMC-RA', 'Finance expenses from insurance contracts issued',
+     EXPENSE_KEYS, RA, 1),
+    ('AMC-CSM', 'Finance expenses from insurance contracts issued',
+     EXPENSE_KEYS, CSM, -1),
+    ('AMC-PV', 'Premiums received', ['MAP002'], ACTUAL, 1),
+    ('AMC-PV', 'Claims and other directly attributable expenses paid',
+     ['MAP012'], ACTUAL, 1),
+    ('AMC-PV', 'Insurance acquisition cash flows', ['MAP015'], ACTUAL, 1),
+    ('ARC-LRC', 'Other contracts recognised', RECOGNISED_KEYS,
+     ['Gross_BE', 'Gross_RA'], 1),
+    ('ARC-LRC', 'Other contracts recognised', RECOGNISED_KEYS, CSM, -1),
+    ('ARC-LRC', 'Other contracts recognised', ['MAP013'],
+     ['Gross_BECFPV', 'Gross_RACFPV'], 1),
+    ('ARC-LC', 'Other contracts recognised', RECOGNISED_KEYS, LOSS, 1),
+    ('ARC-LIC', 'Other contracts recognised', RECOGNISED_KEYS,
+     ['Gross_BE', 'Gross_RA'] + LOSS, 1),
+    ('ARC-LIC', 'Other contracts recognised', RECOGNISED_KEYS, CSM, -1),
+] + [
+    rule for line, keys in [
+        ('Expected incurred claims and other insurance services expenses',
+         ['MAP013']),
+        ('Losses and reversals of losses on onerous contracts', ONEROUS_KEYS),
+        ('Adjustments to liabilities for incurred claims', PAST_SERVICE_KEYS),
+        ('Net finance expenses from insurance contracts', EXPENSE_KEYS),
+    ] for rule in [
+        ('ARC-LRC', line, keys, ['Gross_BE', 'Gross_RA'], 1),
+        ('ARC-LRC', line, keys, CSM, -1),
+        ('ARC-LC', line, keys, LOSS, 1),
+        ('ARC-LIC', line, keys, ['Gross_BE', 'Gross_RA'] + LOSS, 1),
+        ('ARC-LIC', line, keys, CSM, -1),
+    ]
+] + [
+    ('ARC-LRC', 'Premiums received', ['MAP002'], ACTUAL, 1),
+    ('ARC-LRC', 'Actual claims and other expenses paid', ['MAP012'], ACTUAL,
+     1),
+    ('ARC-LIC', 'Actual claims and other expenses paid', ['MAP012'], ACTUAL,
+     1),
+    ('ARC-LRC', 'Insurance acquisition cash flows', ['MAP015'], ACTUAL, 1),
+    ('ARC-LIC', 'Insurance acquisition cash flows', ['MAP015'], ACTUAL, 1),
+])
+
+
+class CompiledMapping:
+    """A mapping table compiled to a (line x key*measure) coefficient matrix.
+
+    ``apply`` evaluates every line for every group and period of an
+    assumption cube with a single matrix multiply.
+    """
+
+    def __init__(self, mapping):
+        mapping = mapping[MAPPING_COLUMNS]
+
+        unknown = mapping.loc[~mapping['Key'].isin(KEYS) |
+                              ~mapping['Measure'].isin(MEASURES)]
+        if len(unknown.index) > 0:
+            raise ValueError("Unknown key or measure in mapping: " + str(
+                unknown[['Key', 'Measure']].values.tolist()))
+
+        self.lines = pd.MultiIndex.from_frame(
+            mapping[['Report', 'Line']].drop_duplicates())
+
+        rows = self.lines.get_indexer(
+            pd.MultiIndex.from_frame(mapping[['Report', 'Line']]))
+        cols = (pd.Index(KEYS).get_indexer(mapping['Key']) * len(MEASURES) +
+                pd.Index(MEASURES).get_indexer(mapping['Measure']))
+
+        self.matrix = np.zeros((len(self.lines), len(KEYS) * len(MEASURES)))
+        np.add.at(self.matrix, (rows, cols),
+                  mapping['Sign'].to_numpy(dtype=float))
+
+    def apply(self, values):
+        flat = values.reshape(values.shape[:-2] + (-1, ))
+        return flat @ self.matrix.T
+
+    def report(self, name, lines):
+        return {
+            line: lines[..., i]
+            for i, (report, line) in enumerate(self.lines) if report == name
+        }
@@ -0,0 +1,38 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+from IFRS17.cube import GROUP
+
+# Chunks handed out per worker, so that one slow chunk does not hold up the
+# rest of the pool
+CHUNKS_PER_WORKER = 4
+
+
+def group_chunks(assumptions, chunks):
+    """Split the assumptions into at most ``chunks`` frames of whole
+    Product/Sub-Product groups.
+
+    Every chunk is a contiguous run of the sorted groups holding roughly the
+    same number of rows, so results concatenated in chunk order come out in
+    the same group order as a serial run. Rows without a group are dropped.
+    """
+    group = assumptions.groupby(GROUP, sort=True).ngroup().to_numpy()
+    labelled = group >= 0
+    sizes = np.bincount(group[labelled])
+    if len(sizes) == 0:
+        return []
+
+    # Each group goes to the chunk holding the midpoint of its rows
+    midpoints = np.cumsum(sizes) - sizes / 2
+    chunk = np.minimum((midpoints * chunks / sizes.sum()).astype(int),
+                       chunks - 1)
+
+    rows = np.full(len(group), -1)
+    rows[labelled] = chunk[group[labelled]]
+    return [assumptions.loc[rows == i] for i in np.unique(chunk)]
+
+
+def map_chunks(function, chunks, workers):
+    # Results are returned in chunk order whatever order they finish in
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(function, chunks))
@@ -0,0 +1,236 @@
+import pandas as pd
+import numpy as np
+
+from IFRS17.kernels import roll_forward
+
+MEASURE_ABMC = [
+    "Present value of future cash flows", "Risk Adjustment",
+    "Contractual Service Margin", "Total"
+]
+
+# Mapping report of each measure of the analysis by measurement component
+AMC_REPORTS = {
+    "Present value of future cash flows": 'AMC-PV',
+    "Risk Adjustment": 'AMC-RA',
+    "Contractual Service Margin": 'AMC-CSM',
+}
+
+AMC_COLUMNS = [
+    'Net balance at 1 January',
+    'CSM recognised in profit or loss for the services provided',
+    'Risk Adjustment recognised for the risk expired',
+    'Experience adjustments',
+    'Changes that relate to current service',
+    'Changes in estimates that adjust the CSM',
+    'Changes in onerous contract losses or reversal of losses',
+    'Contracts initially recognised in the period',
+    'Changes that relate to future service',
+    'Adjustments to liabilities for incurred claims',
+    'Changes that relate to past service',
+    'Insurance service result',
+    'Finance expenses from insurance contracts issued',
+    'Effects of movements in exchange rates',
+    'Investment Component and Premium Refund',
+    'Total recognised in comprehensive income',
+    'Premiums received',
+    'Claims and other directly attributable expenses paid',
+    'Insurance acquisition cash flows',
+    'Total cash flows',
+    'Net balance at 31 December',
+]
+
+MEASURE_ABRC = [
+    "Liabilities for remaining coverage - Excluding loss component",
+    "Liabilities for remaining coverage - Only Loss Component",
+    "Liabilities for incurred claims", "Total"
+]
+
+# Mapping report and business type of each measure of the analysis by
+# remaining coverage
+ARC_REPORTS = {
+    "Liabilities for remaining coverage - Excluding loss component":
+    ('ARC-LRC', 'NB'),
+    "Liabilities for remaining coverage - Only Loss Component":
+    ('ARC-LC', 'NB'),
+    "Liabilities for incurred claims": ('ARC-LIC', 'IF'),
+}
+
+ARC_COLUMNS = [
+    'Net balance at 1 January',
+    'Changes in the statement of profit and loss and OCI',
+    'Other contracts recognised',
+    'Expected incurred claims and other insurance services expenses',
+    'Amortisation of insurance acquisition cash flows',
+    'Losses and reversals of losses on onerous contracts',
+    'Adjustments to liabilities for incurred claims',
+    'Insurance service result',
+    'Net finance expenses from insurance contracts',
+    'Effect of movement in exchange rates',
+    'Investment components and premium refunds',
+    'Total changes in the statement of profit and loss and OCI',
+    'Premiums received',
+    'Actual claims and other expenses paid',
+    'Insurance acquisition cash flows',
+    'Total cash flows',
+    'Other items transfer in the statement of financial position',
+    'Net balance at 31 December',
+]
+
+
+class ReportBuilder:
+    """Preallocated (group x period x measure x column) block of a report.
+
+    Cells are written a whole column at a time for every group and period,
+    ``builder[measure, column] = values``, and the block is turned into one
+    DataFrame with exactly one row per group, period and measure at the end.
+    Use ``slice(None)`` as the measure to address all measures at once.
+    """
+
+    def __init__(self, groups, periods, measures, columns):
+        self.groups = groups
+        self.periods = periods
+        self.measures = list(measures)
+        self.columns = list(columns)
+        self.values = np.zeros((len(groups), len(periods), len(self.measures),
+                                len(self.columns)))
+
+    def _index(self, item):
+        measure, column = item
+        if not isinstance(measure, slice):
+            measure = self.measures.index(measure)
+        return (slice(None), slice(None), measure, self.columns.index(column))
+
+    def __getitem__(self, item):
+        return self.values[self._index(item)]
+
+    def __setitem__(self, item, value):
+        self.values[self._index(item)] = value
+
+    def total(self, measure="Total"):
+        # The total measure is the sum of every other measure, column by column
+        i = self.measures.index(measure)
+        others = [j for j in range(len(self.measures)) if j != i]
+        self.values[:, :, i] = self.values[:, :, others].sum(axis=2)
+
+    def frame(self, order):
+        groups, periods, measures = (len(self.groups), len(self.periods),
+                                     len(self.measures))
+        labels = {
+            "Period": np.tile(np.repeat(self.periods, measures), groups),
+            "Measure": np.tile(self.measures, groups * periods),
+        }
+        for name in self.groups.names:
+            labels[name] = np.repeat(self.groups.get_level_values(name),
+                                     periods * measures)
+
+        # Further group levels, such as Scenario or Cohort, are shown
+        # together with Product and Sub-Product
+        names = list(self.groups.names)
+        first = min(i for i, name in enumerate(order) if name in names)
+        order = ([name for name in order[:first] if name not in names] +
+                 names + [name for name in order[first:] if name not in names])
+        frame = pd.DataFrame({name: labels[name] for name in order})
+        values = self.values.reshape(-1, len(self.columns))
+        return pd.concat(
+            [frame, pd.DataFrame(values, columns=self.columns)], axis=1)
+
+
+def roll_balances(builder, change, opening, closing):
+    # Net balances of every measure rolled forward over the period axis
+    balances = roll_forward(np.moveaxis(change, 1, -1))
+    builder[:, opening], builder[:, closing] = (np.moveaxis(balance, -1, 1)
+                                                for balance in balances)
+
+
+def analysis_by_measurement_component(groups, periods, lines, new_business):
+    """Build the analysis by measurement component.
+
+    ``lines`` maps each measure to its mapped columns and ``new_business``
+    maps each measure to the New Business movement of its reconciliation,
+    both as (group x period) arrays.
+    """
+    amc = ReportBuilder(groups, periods, MEASURE_ABMC, AMC_COLUMNS)
+    for measure in AMC_REPORTS:
+        for column, values in lines[measure].items():
+            amc[measure, column] = values
+        amc[measure, 'Contracts initially recognised in the period'] = (
+            new_business[measure])
+
+    every = slice(None)
+    amc[every, 'Changes that relate to current service'] = (
+        amc[every, 'CSM recognised in profit or loss for the services provided']
+        + amc[every, 'Risk Adjustment recognised for the risk expired'] +
+        amc[every, 'Experience adjustments'])
+    amc[every, 'Changes that relate to future service'] = (
+        amc[every, 'Changes in estimates that adjust the CSM'] +
+        amc[every, 'Changes in onerous contract losses or reversal of losses'] +
+        amc[every, 'Contracts initially recognised in the period'])
+    amc[every, 'Changes that relate to past service'] = amc[
+        every, 'Adjustments to liabilities for incurred claims']
+    amc[every, 'Insurance service result'] = (
+        amc[every, 'Changes that relate to current service'] +
+        amc[every, 'Changes that relate to future service'] +
+        amc[every, 'Changes that relate to past service'])
+    amc[every, 'Investment Component and Premium Refund'] = (
+        amc[every, 'Finance expenses from insurance contracts issued'] +
+        amc[every, 'Effects of movements in exchange rates'])
+    amc[every, 'Total recognised in comprehensive income'] = (
+        amc[every, 'Insurance service result'] +
+        amc[every, 'Investment Component and Premium Refund'])
+    amc[every, 'Total cash flows'] = (
+        amc[every, 'Premiums received'] +
+        amc[every, 'Claims and other directly attributable expenses paid'] +
+        amc[every, 'Insurance acquisition cash flows'])
+
+    roll_balances(
+        amc, amc[every, 'Total recognised in comprehensive income'] +
+        amc[every, 'Total cash flows'], 'Net balance at 1 January',
+        'Net balance at 31 December')
+    amc.total()
+
+    return amc.frame(["Period", "Product", "Sub-Product", "Measure"])
+
+
+def analysis_by_remaining_coverage(groups, periods, lines, recognised):
+    """Build the analysis by remaining coverage.
+
+    ``lines`` maps each measure to its mapped columns and ``recognised``
+    maps each measure to the amount it takes up on initial recognition,
+    both as (group x period) arrays.
+    """
+    arc = ReportBuilder(groups, periods, MEASURE_ABRC, ARC_COLUMNS)
+    for measure in ARC_REPORTS:
+        for column, values in lines[measure].items():
+            arc[measure, column] = values
+        arc[measure, 'Other contracts recognised'] += recognised.get(
+            measure, 0)
+
+    every = slice(None)
+    arc[every, 'Insurance service result'] = (
+        arc[every, 'Other contracts recognised'] + arc[
+            every,
+            'Expected incurred claims and other insurance services expenses'] +
+        arc[every, 'Amortisation of insurance acquisition cash flows'] +
+        arc[every, 'Losses and reversals of losses on onerous contracts'] +
+        arc[every, 'Adjustments to liabilities for incurred claims'])
+    arc[every, 'Investment components and premium refunds'] = (
+        arc[every, 'Net finance expenses from insurance contracts'] +
+        arc[every, 'Effect of movement in exchange rates'])
+    arc[every,
+        'Total changes in the statement of profit and loss and OCI'] = (
+            arc[every, 'Insurance service result'] +
+            arc[every, 'Investment components and premium refunds'])
+    arc[every, 'Total cash flows'] = (
+        arc[every, 'Premiums received'] +
+        arc[every, 'Actual claims and other expenses paid'] +
+        arc[every, 'Insurance acquisition cash flows'])
+
+    roll_balances(
+        arc,
+        arc[every, 'Total changes in the statement of profit and loss and OCI']
+        + arc[every, 'Total cash flows'] +
+        arc[every, 'Other items transfer in the statement of financial position'],
+        'Net balance at 1 January', 'Net balance at 31 December')
+    arc.total()
+
+    return arc.frame(["Period", "Measure", "Product", "Sub-Product"])
@@ -0,0 +1,61 @@
+from IFRS17.cube import AssumptionCube, EncodedAssumptions, stack_cubes
+from IFRS17.engine import GMMEngine, reporting_periods, stage
+
+
+class ScenarioEngine(GMMEngine):
+    """``GMMEngine`` over several assumption sets in one pass.
+
+    ``scenarios`` maps scenario names to assumption tables. With a ``base``
+    table each scenario only holds its deltas, rows that are added to the
+    base, so a stress of MAP009 needs just the MAP009 rows. The cubes of
+    all scenarios are stacked under a leading Scenario group level and
+    evaluated together, and every report carries a Scenario column.
+    Scenario runs are always evaluated serially and in full, ``update`` is
+    not available.
+    """
+
+    def __init__(self,
+                 scenarios,
+                 parameters,
+                 base=None,
+                 mapping=None,
+                 sink=None):
+        self.Scenarios = scenarios
+        self.Base = base
+        super().__init__(None, parameters, mapping=mapping, sink=sink)
+
+    def update(self, assumptions, parameters=None):
+        raise TypeError(
+            "Incremental updates are not available for scenario runs, "
+            "create a new ScenarioEngine instead")
+
+    @stage
+    def cube(self):
+        periods = reporting_periods(self.settings)
+        frequency = self.settings['frequency']
+
+        encoded = {
+            name: EncodedAssumptions(assumptions, frequency)
+            for name, assumptions in self.Scenarios.items()
+        }
+        base = None if self.Base is None else EncodedAssumptions(
+            self.Base, frequency)
+
+        # Every scenario is laid out on the groups of all of them
+        groups = None
+        for assumptions in list(encoded.values()) + [base]:
+            if assumptions is not None:
+                groups = (assumptions.groups if groups is None else
+                          groups.union(assumptions.groups))
+
+        cubes = [
+            AssumptionCube(assumptions, periods, groups)
+            for assumptions in encoded.values()
+        ]
+        if base is not None:
+            base = AssumptionCube(base, periods, groups)
+            for cube in cubes:
+                cube.by_type += base.by_type
+                cube.values += base.values
+
+        return stack_cubes(cubes, list(encoded))
@@ -0,0 +1,70 @@
+import os
+
+from IFRS17.cube import GROUP
+
+# File name of each report, SQL tables are named after the report itself
+REPORT_NAMES = {
+    'BEL': 'Reconciliation_of_Best_Estimate_Liability',
+    'RA': 'Reconciliation_of_Risk_Adjustment',
+    'CSM': 'Reconciliation_of_Contractual_Service_Margin',
+    'TCL': 'Reconciliation_of_Total_Contract_Liability',
+    'AMC': 'Analysis_by_measurement_component',
+    'ARC': 'Analysis_by_remaining_coverage',
+}
+
+
+class CSVSink:
+    """Writes each report to ``<directory>/<report name>.csv``."""
+
+    def __init__(self, directory='.'):
+        self.directory = directory
+
+    def write(self, report, frame):
+        frame.to_csv(
+            os.path.join(self.directory, REPORT_NAMES[report] + '.csv'))
+
+
+class ParquetSink:
+    """Writes each report to ``<directory>/<report name>.parquet``.
+
+    Reports are written as datasets with one directory per Product and
+    Sub-Product unless ``partitioned`` is False. Needs pyarrow.
+    """
+
+    def __init__(self, directory='.', partitioned=True):
+        self.directory = directory
+        self.partitioned = partitioned
+
+    def write(self, report, frame):
+        path = os.path.join(self.directory, REPORT_NAMES[report] + '.parquet')
+        if self.partitioned:
+            # Partitions of an earlier write are replaced, not appended to
+            frame.to_parquet(path,
+                             engine='pyarrow',
+                             partition_cols=GROUP,
+                             existing_data_behavior='delete_matching')
+        else:
+            frame.to_parquet(path, engine='pyarrow')
+
+
+class SQLSink:
+    """Writes each report to a table of the same name (BEL, RA, ...).
+
+    ``connection`` is anything ``DataFrame.to_sql`` accepts, such as a
+    SQLAlchemy engine.
+    """
+
+    def __init__(self, connection, if_exists='replace'):
+        self.connection = connection
+        self.if_exists = if_exists
+
+    def write(self, report, frame):
+        frame.to_sql(report, self.connection, if_exists=self.if_exists)
+
+
+def write_reports(reports, sink):
+    # No sink keeps the reports in memory only
+    if sink is None:
+        return
+    for report, frame in reports.items():
+        sink.write(report, frame)
@@ -0,0 +1,175 @@
+import json
+import os
+import struct
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from IFRS17.cube import GROUP
+from IFRS17.reports import ReportBuilder
+
+MAGIC = b'IFRS17RS'
+
+# Blocks start on a 64 byte boundary so that every report maps aligned
+ALIGNMENT = 64
+
+# Columns that can identify a group, in the order of their levels
+LEVELS = ['Scenario'] + GROUP + ['Cohort']
+
+
+def _layout(frame, levels):
+    # Label columns of a report, in the order the report shows them
+    labels = [c for c in frame.columns if c in levels + ['Period', 'Measure']]
+    if 'Period' not in labels:
+        labels = ['Period'] + labels
+    return labels
+
+
+def write_store(path, reports):
+    """Write reports to a fixed-layout binary store at ``path``.
+
+    ``reports`` maps report names to frames laid out like those of
+    ``GMMEngine`` (BEL, RA, CSM, TCL, AMC, ARC). The file starts with a
+    JSON header giving the groups, periods and, for every report, its
+    measures, columns and the offset and shape of its float64 block of
+    (group x period [x measure] x column) values.
+    """
+    frames = {
+        name: frame.reset_index() if 'Period' not in frame.columns else frame
+        for name, frame in reports.items()
+    }
+    first = next(iter(frames.values()), None)
+    levels = [c for c in LEVELS if first is not None and c in first.columns]
+    groups = pd.MultiIndex.from_frame(first[levels]).unique() if (
+        first is not None) else pd.MultiIndex.from_tuples([], names=GROUP)
+    periods = pd.Index(first['Period'].unique() if first is not None else [])
+
+    # Sub-annual periods are stored as text with their frequency
+    frequency = getattr(periods, 'freqstr', None)
+    header = {
+        'levels': list(groups.names),
+        'groups': [list(group) for group in groups],
+        'periods': periods.astype(str).tolist() if frequency else
+        periods.tolist(),
+        'frequency': frequency,
+        'reports': {}
+    }
+    blocks = []
+    offset = 0
+    for name, frame in frames.items():
+        labels = _layout(frame, levels)
+        columns = [c for c in frame.columns if c not in labels]
+        measures = (list(frame['Measure'].unique())
+                    if 'Measure' in labels else None)
+
+        # Rows are placed by their labels, whatever order the frame has
+        position = [
+            groups.get_indexer(pd.MultiIndex.from_frame(frame[levels])),
+            periods.get_indexer(frame['Period'])
+        ]
+        shape = [len(groups), len(periods)]
+        if measures is not None:
+            position.append(pd.Index(measures).get_indexer(frame['Measure']))
+            shape.append(len(measures))
+        block = np.zeros(shape + [len(columns)])
+        block[tuple(position)] = frame[columns].to_numpy(dtype=float)
+
+        header['reports'][name] = {
+            'labels': labels,
+            'measures': measures,
+            'columns': columns,
+            'offset': offset,
+            'shape': list(block.shape),
+        }
+        blocks.append(block)
+        offset += -(-block.nbytes // ALIGNMENT) * ALIGNMENT
+
+    encoded = json.dumps(header).encode()
+    start = -(-(len(MAGIC) + 8 + len(encoded)) // ALIGNMENT) * ALIGNMENT
+
+    # Written under a temporary name of its own so that readers never map
+    # a partial file and concurrent writers never share one
+    descriptor, temporary = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            file.write(MAGIC + struct.pack('<Q', len(encoded)) + encoded)
+            for block, report in zip(blocks, header['reports'].values()):
+                file.seek(start + report['offset'])
+                file.write(np.ascontiguousarray(block, dtype='<f8').tobytes())
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+
+class ResultStore:
+    """Read-only view of a store written by ``write_store``.
+
+    The values are memory-mapped, not read: ``store['AMC']`` is a
+    (group x period x measure x column) array backed by the file, so
+    slicing it only touches the pages needed and processes opening the
+    same store share its memory.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(path + " is not a result store")
+            size, = struct.unpack('<Q', file.read(8))
+            header = json.loads(file.read(size))
+
+        self.path = path
+        self.groups = pd.MultiIndex.from_tuples(
+            [tuple(group) for group in header['groups']],
+            names=header['levels'])
+        if header.get('frequency'):
+            self.periods = pd.PeriodIndex(header['periods'],
+                                          freq=header['frequency'],
+                                          name='Period')
+        else:
+            self.periods = pd.Index(header['periods'], name='Period')
+        self.reports = header['reports']
+        self._start = -(-(len(MAGIC) + 8 + size) // ALIGNMENT) * ALIGNMENT
+
+    def __getitem__(self, report):
+        layout = self.reports[report]
+        return np.memmap(self.path,
+                         dtype='<f8',
+                         mode='r',
+                         offset=self._start + layout['offset'],
+                         shape=tuple(layout['shape']))
+
+    def frame(self, report, groups=None):
+        """The report as a DataFrame, for all groups or a list of
+        (Product, Sub-Product) pairs."""
+        layout = self.reports[report]
+        values = self[report]
+        selected = self.groups
+        if groups is not None:
+            selected = pd.MultiIndex.from_tuples(groups,
+                                                 names=self.groups.names)
+            rows = self.groups.get_indexer(selected)
+            if (rows < 0).any():
+                raise KeyError("Groups not in the store: " +
+                               str(list(selected[rows < 0])))
+            values = values[rows]
+
+        if layout['measures'] is not None:
+            builder = ReportBuilder(selected, self.periods,
+                                    layout['measures'], layout['columns'])
+            builder.values = np.asarray(values)
+            return builder.frame(layout['labels'])
+
+        frame = pd.DataFrame(
+            {
+                name: np.repeat(selected.get_level_values(name),
+                                len(self.periods))
+                for name in selected.names
+            },
+            index=pd.Index(np.tile(self.periods, len(selected)),
+                           name='Period'))
+        for i, column in enumerate(layout['columns']):
+            frame[column] = np.asarray(values[..., i]).reshape(-1)
+        return frame
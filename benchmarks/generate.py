@@ -0,0 +1,88 @@
+"""
+Synthetic assumption tables in the layout of ``notebook/sample.csv``
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from IFRS17.cube import KEYS, MEASURES
+
+SAMPLE = os.path.join(os.path.dirname(__file__), '..', 'notebook',
+                      'sample.csv')
+
+
+def synthetic_assumptions(products=4,
+                          subproducts=5,
+                          cohorts=4,
+                          first_cohort=2019,
+                          keys=KEYS,
+                          nb_share=0.5,
+                          rows_per_cell=1,
+                          seed=0):
+    """Random assumption table for products * subproducts groups over
+    ``cohorts`` years, split over ``rows_per_cell`` seriatim-like rows.
+
+    Every Key and BusinessType that appears in ``notebook/sample.csv``
+    appears in each group and cohort with the mean measures of the sample
+    scaled by log-normal noise, so signs, magnitudes and empty measures look
+    like the real extract. The first cohort always writes new business,
+    each later one does with probability ``nb_share`` and holds its IF rows
+    only otherwise.
+    """
+    random = np.random.default_rng(seed)
+    template = pd.read_csv(SAMPLE).groupby(['Key', 'BusinessType'])[
+        MEASURES].mean().fillna(0).reset_index()
+    template = template.loc[template['Key'].isin(keys)]
+
+    cells = pd.MultiIndex.from_product(
+        [['P%03d' % i for i in range(products)],
+         ['S%03d' % i for i in range(subproducts)],
+         range(first_cohort, first_cohort + cohorts),
+         range(len(template.index))],
+        names=['Product', 'Sub-Product', 'Cohort', 'Template']).to_frame(
+            index=False)
+    cells = pd.concat([
+        cells, template.iloc[cells.pop('Template')].reset_index(drop=True)
+    ], axis=1)
+
+    writes = random.random((products, subproducts, cohorts)) < nb_share
+    writes[:, :, 0] = True
+    nb = writes.reshape(-1)[cells.index.to_numpy() //
+                            len(template.index)]
+    cells = cells.loc[nb | (cells['BusinessType'] != 'NB')]
+
+    values = cells[MEASURES].to_numpy() * random.lognormal(
+        0, 0.3, (len(cells.index), len(MEASURES)))
+
+    rows = cells.loc[cells.index.repeat(rows_per_cell)].reset_index(
+        drop=True)
+    rows['Key Label'] = rows['Key']
+    rows[MEASURES] = np.repeat(values / rows_per_cell, rows_per_cell, axis=0)
+    return rows[['Cohort', 'Product', 'Sub-Product', 'Key Label',
+                 'BusinessType', 'Key'] + MEASURES]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('output')
+    parser.add_argument('--products', type=int, default=4)
+    parser.add_argument('--subproducts', type=int, default=5)
+    parser.add_argument('--cohorts', type=int, default=4)
+    parser.add_argument('--first-cohort', type=int, default=2019)
+    parser.add_argument('--nb-share', type=float, default=0.5)
+    parser.add_argument('--rows-per-cell', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    synthetic_assumptions(products=args.products,
+                          subproducts=args.subproducts,
+                          cohorts=args.cohorts,
+                          first_cohort=args.first_cohort,
+                          nb_share=args.nb_share,
+                          rows_per_cell=args.rows_per_cell,
+                          seed=args.seed).to_csv(args.output, index=False)
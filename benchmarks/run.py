@@ -0,0 +1,102 @@
+"""
+Times GMM end to end and every stage of GMMEngine on synthetic portfolios
+and writes the timings as JSON
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from generate import synthetic_assumptions
+from IFRS17.engine import GMMEngine
+from IFRS17.gmm import GMM
+
+# Portfolio shapes, 32 rows per Product/Sub-Product/Cohort cell at most
+SIZES = {
+    'small': dict(products=2, subproducts=2, cohorts=4),
+    'medium': dict(products=10, subproducts=10, cohorts=4),
+    'large': dict(products=20, subproducts=25, cohorts=4, rows_per_cell=10),
+    'xlarge': dict(products=50, subproducts=40, cohorts=4, rows_per_cell=20),
+}
+
+# Lazily evaluated engine results, in dependency order, so that each stage
+# is timed on its own
+STAGES = [
+    'cube', 'mapped', 'Liability_on_Initial_Recognition', 'BEL', 'RA', 'CSM',
+    'TCL', 'AMC', 'ARC'
+]
+
+PARAMETERS = pd.DataFrame({
+    'Parameter': [
+        'Start of Reporting Period', 'End of Reporting Period', 'CSM Mode'
+    ],
+    'Selection': ['01/01/2019', '31/12/2022', 'Calculation']
+})
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def benchmark(size, gmm_max_rows, workers):
+    assumptions, generate = timed(
+        lambda: synthetic_assumptions(**SIZES[size]))
+    result = {
+        'size': size,
+        'rows': len(assumptions.index),
+        'groups': SIZES[size]['products'] * SIZES[size]['subproducts'],
+        'generate': generate,
+    }
+
+    engine = GMMEngine(assumptions, PARAMETERS)
+    result['engine'] = {}
+    for stage in STAGES:
+        _, result['engine'][stage] = timed(
+            lambda: getattr(engine, stage))
+    result['engine']['total'] = sum(result['engine'].values())
+
+    if workers > 1:
+        parallel = GMMEngine(assumptions, PARAMETERS, workers=workers)
+        _, result['engine_workers'] = timed(
+            lambda: [getattr(parallel, stage) for stage in STAGES[2:]])
+
+    # The legacy model walks every group and period in Python
+    if len(assumptions.index) <= gmm_max_rows:
+        gmm, result['gmm'] = timed(lambda: GMM(assumptions, PARAMETERS))
+        result['gmm_stages'] = gmm.Timings.groupby(
+            'Stage', sort=False)['Wall'].sum().to_dict()
+    return result
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', nargs='+', default=['small', 'medium'],
+                        choices=list(SIZES))
+    parser.add_argument('--gmm-max-rows', type=int, default=5000)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--output', default='benchmark_results.json')
+    args = parser.parse_args()
+
+    results = {
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'machine': platform.machine(),
+        'cpus': os.cpu_count(),
+        'runs': [],
+    }
+    for size in args.sizes:
+        run = benchmark(size, args.gmm_max_rows, args.workers)
+        results['runs'].append(run)
+        print(json.dumps(run))
+
+    with open(args.output, 'w') as file:
+        json.dump(results, file, indent=2)
@@ -0,0 +1,50 @@
+import os
+
+import pandas as pd
+import pytest
+
+from IFRS17.sinks import REPORT_NAMES
+
+SAMPLE = os.path.join(os.path.dirname(__file__), os.pardir, 'notebook',
+                      'sample.csv')
+
+
+def _parameters(mode='Calculation', **selections):
+    # Further rows are given by their label with underscores for spaces
+    labels = [
+        'Start of Reporting Period', 'End of Reporting Period', 'CSM Mode'
+    ]
+    values = ['01/01/2019', '31/12/2022', mode]
+    for label, value in selections.items():
+        labels.append(label.replace('_', ' '))
+        values.append(value)
+    return pd.DataFrame({'Parameter': labels, 'Selection': values})
+
+
+@pytest.fixture(scope='session')
+def sample_path():
+    return SAMPLE
+
+
+@pytest.fixture(scope='session')
+def sample():
+    return pd.read_csv(SAMPLE)
+
+
+@pytest.fixture(scope='session')
+def parameters():
+    # Parameters for a CSM Mode, Calculation by default, and any other rows
+    return _parameters
+
+
+def _assert_same_reports(got, expected, names=REPORT_NAMES):
+    for name in names:
+        pd.testing.assert_frame_equal(getattr(got, name),
+                                      getattr(expected, name),
+                                      obj=name)
+
+
+@pytest.fixture(scope='session')
+def assert_same_reports():
+    # Compares the reports of two engines frame by frame
+    return _assert_same_reports
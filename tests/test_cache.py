@@ -0,0 +1,75 @@
+import os
+
+from IFRS17.cache import ResultCache, run_key
+from IFRS17.engine import GMMEngine
+from IFRS17.mapping import DEFAULT_MAPPING
+
+
+def test_cached_run_matches_full_run(sample, parameters, assert_same_reports,
+                                     tmp_path):
+    cache = ResultCache(str(tmp_path))
+    first = cache.run(sample, parameters())
+    again = cache.run(sample, parameters())
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert_same_reports(first, GMMEngine(sample, parameters()))
+    assert_same_reports(again, GMMEngine(sample, parameters()))
+    assert [
+        name for name in os.listdir(str(tmp_path)) if not name.endswith('.pkl')
+    ] == []
+
+
+def test_key_ignores_row_order(sample, parameters):
+    shuffled = sample.sample(frac=1, random_state=12)
+    assert run_key(shuffled, parameters()) == run_key(sample, parameters())
+
+
+def test_key_covers_parameters_and_mapping(sample, parameters):
+    mapping = DEFAULT_MAPPING.copy()
+    mapping.loc[0, 'Sign'] = -1
+    keys = {
+        run_key(sample, parameters()),
+        run_key(sample, parameters('Input')),
+        run_key(sample, parameters(), mapping)
+    }
+    assert len(keys) == 3
+
+
+def test_damaged_entry_is_a_miss(sample, parameters, assert_same_reports,
+                                 tmp_path):
+    cache = ResultCache(str(tmp_path))
+    cache.run(sample, parameters())
+    for name in os.listdir(str(tmp_path)):
+        with open(os.path.join(str(tmp_path), name), 'wb'):
+            pass
+
+    engine = cache.run(sample, parameters())
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert_same_reports(engine, GMMEngine(sample, parameters()))
+
+
+def test_least_recently_used_entries_are_evicted(sample, parameters, tmp_path):
+    cache = ResultCache(str(tmp_path), max_bytes=1)
+    cache.run(sample, parameters())
+    cache.run(sample, parameters('Input'))
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_cached_incremental_run(sample, parameters, assert_same_reports,
+                                tmp_path):
+    corrected = sample.copy()
+    corrected.loc[corrected['Sub-Product'] == 'ABC', 'Gross_BE'] *= 1.1
+    cache = ResultCache(str(tmp_path))
+    first = cache.run(sample, parameters())
+    updated = cache.run(corrected, parameters(), previous=first, workers=2)
+    assert cache.misses == 2
+    assert_same_reports(updated, GMMEngine(corrected, parameters()))
+
+    # Stored under the key of the arguments it was evaluated with
+    again = ResultCache(str(tmp_path)).run(corrected, parameters())
+    assert_same_reports(again, updated)
+
+
+def test_key_covers_the_grouping(sample, parameters):
+    assert run_key(sample, parameters()) != run_key(sample,
+                                                    parameters(),
+                                                    by_cohort=True)
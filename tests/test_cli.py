@@ -0,0 +1,75 @@
+import os
+
+import pandas as pd
+import pytest
+
+from IFRS17.cli import main
+from IFRS17.engine import GMMEngine
+from IFRS17.sinks import REPORT_NAMES
+from IFRS17.store import ResultStore
+
+PARAMETERS = os.path.join(os.path.dirname(__file__), os.pardir, 'notebook',
+                          'Parameters.csv')
+
+
+@pytest.fixture(scope='module')
+def engine(sample):
+    return GMMEngine(sample, pd.read_csv(PARAMETERS))
+
+
+def test_csv_reports(sample_path, engine, tmp_path, capsys):
+    assert main([sample_path, PARAMETERS, '--output', str(tmp_path)]) == 0
+    for name, file in REPORT_NAMES.items():
+        written = pd.read_csv(str(tmp_path / (file + '.csv')), index_col=0)
+        expected = getattr(engine, name)
+        assert list(written.columns) == list(expected.columns)
+        assert written.select_dtypes('number').to_numpy() == pytest.approx(
+            expected.select_dtypes('number').to_numpy())
+    assert 'Assumptions: ' in capsys.readouterr().out
+
+
+def test_store_of_selected_groups(sample_path, engine, tmp_path):
+    assert main([
+        sample_path, PARAMETERS, '--output',
+        str(tmp_path), '--format', 'store', '--group', 'NPA', 'XYZ'
+    ]) == 0
+    store = ResultStore(str(tmp_path / 'results.ifrs17'))
+    expected = engine.BEL[engine.BEL['Sub-Product'] == 'XYZ']
+    pd.testing.assert_frame_equal(store.frame('BEL'), expected)
+
+
+def test_cached_incremental_run(sample, sample_path, tmp_path, capsys):
+    corrected = sample.copy()
+    corrected.loc[corrected['Sub-Product'] == 'ABC', 'Gross_BE'] *= 1.1
+    path = str(tmp_path / 'corrected.csv')
+    corrected.to_csv(path, index=False)
+
+    cache = str(tmp_path / 'cache')
+    arguments = ['--output', str(tmp_path / 'reports'), '--cache', cache]
+    assert main([sample_path, PARAMETERS] + arguments) == 0
+    assert main([path, PARAMETERS, '--previous', sample_path] + arguments) == 0
+    assert 'Cache: 1 hits, 1 misses' in capsys.readouterr().out
+
+    written = pd.read_csv(str(tmp_path / 'reports' /
+                              (REPORT_NAMES['CSM'] + '.csv')),
+                          index_col=0)
+    expected = GMMEngine(corrected, pd.read_csv(PARAMETERS)).CSM
+    assert written['Closing Balance'].to_numpy() == pytest.approx(
+        expected['Closing Balance'].to_numpy())
+
+
+def test_failed_run(sample_path, tmp_path, capsys):
+    assert main([
+        sample_path, PARAMETERS, '--output',
+        str(tmp_path), '--group', 'NPA', 'MISSING'
+    ]) == 1
+    assert 'IFRS17 run failed' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('arguments',
+                         [['--format', 'xlsx'], ['--previous', 'old.csv'],
+                          ['--workers', '0'], ['--workers', '-2']])
+def test_invalid_arguments(sample_path, arguments):
+    with pytest.raises(SystemExit) as exit:
+        main([sample_path, PARAMETERS] + arguments)
+    assert exit.value.code == 2
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from IFRS17.engine import GMMEngine
+from IFRS17.sinks import REPORT_NAMES
+from IFRS17.store import ResultStore, write_store
+
+
+@pytest.fixture(scope='module')
+def cohorts(sample):
+    # Each cohort's movements fall in its own year
+    return sample.assign(Period=sample['Cohort'])
+
+
+@pytest.fixture(scope='module')
+def engine(cohorts, parameters):
+    return GMMEngine(cohorts, parameters(), by_cohort=True)
+
+
+def test_reports_carry_the_cohort(engine, cohorts):
+    groups = cohorts[['Product', 'Sub-Product', 'Cohort']].drop_duplicates()
+    assert len(engine.cube.groups) == len(groups.index)
+    for name in REPORT_NAMES:
+        assert 'Cohort' in getattr(engine, name).columns
+    assert engine.Liability_on_Initial_Recognition.index.names == [
+        'Product', 'Sub-Product', 'Cohort'
+    ]
+
+
+def test_single_cohort_matches_product_run(sample, parameters):
+    first = sample[sample['Cohort'] == 2019].assign(Period=2019)
+    engine = GMMEngine(first, parameters(), by_cohort=True)
+    product = GMMEngine(first, parameters())
+    for name in REPORT_NAMES:
+        frame = getattr(engine, name).drop(columns='Cohort')
+        pd.testing.assert_frame_equal(frame, getattr(product, name), obj=name)
+
+
+def test_rollup_sums_the_cohorts(engine):
+    for name in ['CSM', 'AMC']:
+        frame = getattr(engine, name)
+        rolled = engine.rollup(name)
+        assert 'Cohort' not in rolled.columns
+        np.testing.assert_allclose(
+            rolled.select_dtypes('number').drop(columns='Period',
+                                                errors='ignore').sum(),
+            frame.select_dtypes('number').drop(columns=['Period', 'Cohort'],
+                                               errors='ignore').sum())
+
+    lir = engine.rollup('Liability_on_Initial_Recognition')
+    pd.testing.assert_frame_equal(
+        lir,
+        engine.Liability_on_Initial_Recognition.groupby(
+            level=['Product', 'Sub-Product']).sum())
+
+
+def test_cohort_runs_need_a_period(sample, parameters):
+    with pytest.raises(ValueError):
+        GMMEngine(sample, parameters(), by_cohort=True).BEL
+
+
+def test_parallel_and_stored_cohort_runs(engine, cohorts, parameters,
+                                         assert_same_reports, tmp_path):
+    assert_same_reports(
+        GMMEngine(cohorts, parameters(), by_cohort=True, workers=2), engine)
+
+    path = str(tmp_path / 'results.ifrs17')
+    write_store(path, {name: getattr(engine, name) for name in REPORT_NAMES})
+    store = ResultStore(path)
+    for name in REPORT_NAMES:
+        pd.testing.assert_frame_equal(store.frame(name),
+                                      getattr(engine, name),
+                                      obj=name)
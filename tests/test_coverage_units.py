@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from IFRS17.cache import run_key
+from IFRS17.engine import GMMEngine
+
+RELEASE = "Changes Related to Current Service: Release"
+
+
+def derived_units(sample):
+    # The Derived coverage units as a table: expected claims released
+    # within the run
+    rows = (sample['Key'] == 'MAP013') & (sample['Cohort'] <= 2022)
+    claims = sample[rows].groupby(['Product', 'Sub-Product',
+                                   'Cohort'])['Gross_BE'].sum().abs()
+    return claims.rename('Coverage Units').rename_axis(
+        ['Product', 'Sub-Product', 'Period']).reset_index()
+
+
+@pytest.fixture(scope='module')
+def derived(sample, parameters):
+    return GMMEngine(sample, parameters(Coverage_units='Derived'))
+
+
+def test_release_follows_the_units(derived):
+    csm = derived.CSM
+    movements = csm.columns.drop([
+        'Product', 'Sub-Product', 'Opening Balance', RELEASE, 'Closing Balance'
+    ])
+    held = csm['Opening Balance'] + csm[movements].sum(axis=1)
+    fractions = derived._coverage_fractions.reshape(-1)
+    np.testing.assert_allclose(csm[RELEASE], -held * fractions, atol=1e-6)
+
+    # Derived units end within the run, so all of the CSM is released
+    last = csm.index == csm.index.max()
+    np.testing.assert_allclose(csm.loc[last, 'Closing Balance'], 0, atol=1e-6)
+
+
+def test_reports_agree_on_the_release(derived):
+    amc = derived.AMC[derived.AMC['Measure'] == 'Contractual Service Margin']
+    np.testing.assert_allclose(amc['Net balance at 31 December'],
+                               derived.CSM['Closing Balance'])
+    tcl = derived.BEL['Closing Balance'] + derived.RA[
+        'Closing Balance'] + derived.CSM['Closing Balance']
+    np.testing.assert_allclose(derived.TCL['Closing Balance'], tcl)
+
+
+def test_table_of_units_matches_derived(sample, parameters, derived,
+                                        assert_same_reports):
+    engine = GMMEngine(sample,
+                       parameters(),
+                       coverage_units=derived_units(sample))
+    assert_same_reports(engine, derived)
+
+
+def test_units_after_the_run_are_expected_coverage(sample, parameters,
+                                                   derived):
+    units = derived_units(sample)
+    later = units[units['Period'] == 2022].assign(Period=2030)
+    engine = GMMEngine(sample,
+                       parameters(),
+                       coverage_units=pd.concat([units, later]))
+    closing = engine.CSM['Closing Balance']
+    assert (closing[closing.index == 2022].abs() > 1).any()
+
+
+def test_parallel_incremental_and_cached_runs(sample, parameters, derived,
+                                              assert_same_reports):
+    units = derived_units(sample)
+    assert_same_reports(
+        GMMEngine(sample, parameters(), workers=2, coverage_units=units),
+        derived)
+
+    # More coverage in the first year of ABC only
+    changed = units.copy()
+    first = (changed['Sub-Product'] == 'ABC') & (changed['Period'] == 2019)
+    changed.loc[first, 'Coverage Units'] *= 5
+    base = GMMEngine(sample, parameters(), coverage_units=units)
+    updated = GMMEngine(sample,
+                        parameters(),
+                        coverage_units=changed,
+                        previous=base)
+    assert list(updated._dirty) == [('NPA', 'ABC')]
+    assert_same_reports(
+        updated, GMMEngine(sample, parameters(), coverage_units=changed))
+
+    assert run_key(sample, parameters(),
+                   coverage_units=units) != run_key(sample,
+                                                    parameters(),
+                                                    coverage_units=changed)
+
+
+def test_groups_without_units_keep_their_release(sample, parameters):
+    # XYZ releases its CSM from in-force MAP014 rows and has no units
+    assumptions = sample.copy()
+    xyz = assumptions['Sub-Product'] == 'XYZ'
+    assumptions.loc[xyz & (assumptions['Key'] == 'MAP014'),
+                    'BusinessType'] = 'IF'
+    units = derived_units(sample)
+    units = units[units['Sub-Product'] == 'ABC']
+
+    def arc(engine):
+        frame = engine.ARC
+        return frame[frame['Sub-Product'] == 'XYZ'].reset_index(drop=True)
+
+    engine = GMMEngine(assumptions, parameters(), coverage_units=units)
+    pd.testing.assert_frame_equal(arc(engine),
+                                  arc(GMMEngine(assumptions, parameters())))
+    assert not arc(engine).equals(arc(GMMEngine(sample, parameters())))
+
+
+def test_unknown_coverage_units(sample, parameters):
+    with pytest.raises(ValueError):
+        GMMEngine(sample, parameters(Coverage_units='Premiums'))
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from IFRS17.engine import GMMEngine
+from IFRS17.gmm import GMM
+
+# Number of label columns at the front of each report
+REPORTS = {'BEL': 2, 'RA': 2, 'CSM': 2, 'TCL': 2, 'AMC': 4, 'ARC': 4}
+
+
+@pytest.mark.parametrize('mode', ['Calculation', 'Input'])
+def test_engine_matches_gmm(sample, parameters, mode):
+    gmm = GMM(sample, parameters(mode))
+    engine = GMMEngine(sample, parameters(mode))
+
+    for name, labels in REPORTS.items():
+        expected, got = getattr(gmm, name).copy(), getattr(engine, name)
+        if name == 'TCL':
+            # The legacy model fills CLOSING rather than Closing Balance
+            expected['Closing Balance'] = expected.pop('CLOSING')
+
+        assert list(got.columns) == list(expected.columns), name
+        assert got.shape == expected.shape, name
+        assert (got.iloc[:, :labels].astype(str).to_numpy() ==
+                expected.iloc[:, :labels].astype(str).to_numpy()).all(), name
+        if labels == 2:
+            assert list(got.index) == list(expected.index), name
+        np.testing.assert_allclose(got.iloc[:, labels:].to_numpy(float),
+                                   expected.iloc[:, labels:].to_numpy(float),
+                                   rtol=1e-12,
+                                   atol=1e-6,
+                                   err_msg=name)
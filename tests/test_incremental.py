@@ -0,0 +1,49 @@
+import pytest
+
+from IFRS17.engine import GMMEngine
+
+
+@pytest.fixture(scope='module')
+def corrected(sample):
+    # New figures for the ABC sub-product only
+    corrected = sample.copy()
+    rows = corrected['Sub-Product'] == 'ABC'
+    corrected.loc[rows, 'Gross_BE'] *= 1.1
+    return corrected
+
+
+def test_update_matches_full_run(sample, corrected, parameters,
+                                 assert_same_reports):
+    base = GMMEngine(sample, parameters())
+    updated = base.update(corrected)
+    assert list(updated._dirty) == [('NPA', 'ABC')]
+    assert_same_reports(updated, GMMEngine(corrected, parameters()))
+
+
+def test_update_of_parallel_run(sample, corrected, parameters,
+                                assert_same_reports):
+    updated = GMMEngine(sample, parameters(), workers=2).update(corrected)
+    assert_same_reports(updated, GMMEngine(corrected, parameters()))
+
+
+def test_update_with_new_parameters(sample, parameters, assert_same_reports):
+    updated = GMMEngine(sample, parameters()).update(sample,
+                                                     parameters('Input'))
+    assert len(updated._dirty) == 2
+    assert_same_reports(updated, GMMEngine(sample, parameters('Input')))
+
+
+def test_unchanged_run_reuses_every_group(sample, parameters,
+                                          assert_same_reports):
+    base = GMMEngine(sample, parameters())
+    updated = base.update(sample.sample(frac=1, random_state=11))
+    assert len(updated._dirty) == 0
+    assert_same_reports(updated, base)
+
+
+def test_update_needs_the_same_grouping(sample, parameters):
+    with pytest.raises(ValueError):
+        GMMEngine(sample,
+                  parameters(),
+                  by_cohort=True,
+                  previous=GMMEngine(sample, parameters()))
@@ -0,0 +1,46 @@
+import numpy as np
+
+from IFRS17.kernels import amortise, roll_forward
+
+
+def random(*shape):
+    return np.random.default_rng(17).normal(size=shape)
+
+
+def test_roll_forward_matches_loop():
+    change, opening = random(3, 4, 12), random(3, 4)
+    opened, closing = roll_forward(change, opening)
+
+    balance = opening.copy()
+    for t in range(change.shape[-1]):
+        np.testing.assert_allclose(opened[..., t], balance)
+        balance = balance + change[..., t]
+        np.testing.assert_allclose(closing[..., t], balance)
+
+
+def test_roll_forward_opens_at_zero():
+    opened, closing = roll_forward(random(5, 6))
+    np.testing.assert_array_equal(opened[:, 0], 0)
+    np.testing.assert_allclose(opened[:, 1:], closing[:, :-1])
+
+
+def test_amortise_matches_loop():
+    change, opening = random(3, 4, 12), random(3, 4)
+    fraction = np.random.default_rng(25).uniform(size=change.shape)
+    opened, release, closing = amortise(change, fraction, opening)
+
+    balance = opening.copy()
+    for t in range(change.shape[-1]):
+        np.testing.assert_allclose(opened[..., t], balance)
+        held = balance + change[..., t]
+        np.testing.assert_allclose(release[..., t], -held * fraction[..., t])
+        balance = held * (1 - fraction[..., t])
+        np.testing.assert_allclose(closing[..., t], balance)
+
+
+def test_amortise_broadcasts_fraction():
+    change = random(4, 12)
+    got = amortise(change, np.full(12, 0.1))
+    expected = amortise(change, np.full(change.shape, 0.1))
+    for got, expected in zip(got, expected):
+        np.testing.assert_allclose(got, expected)
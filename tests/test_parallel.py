@@ -0,0 +1,59 @@
+import pytest
+
+from IFRS17 import engine
+from IFRS17.engine import GMMEngine
+from IFRS17.parallel import group_chunks, map_chunks
+
+
+@pytest.mark.parametrize('mode', ['Calculation', 'Input'])
+def test_workers_match_serial(sample, parameters, assert_same_reports, mode):
+    assert_same_reports(GMMEngine(sample, parameters(mode), workers=2),
+                        GMMEngine(sample, parameters(mode)))
+
+
+def test_chunks_keep_groups_whole(sample):
+    chunks = group_chunks(sample, 4)
+    assert sum(len(chunk.index) for chunk in chunks) == len(sample.index)
+    groups = [
+        set(map(tuple, chunk[['Product', 'Sub-Product']].values))
+        for chunk in chunks
+    ]
+    assert all(not (a & b) for i, a in enumerate(groups)
+               for b in groups[i + 1:])
+
+
+def test_workers_only_evaluate_what_is_asked(sample, parameters, monkeypatch):
+    passes = []
+
+    def counted(function, chunks, workers):
+        passes.append(function.keywords['names'])
+        return map_chunks(function, chunks, workers)
+
+    monkeypatch.setattr(engine, 'map_chunks', counted)
+    parallel = GMMEngine(sample, parameters(), workers=2)
+    parallel.TCL
+    parallel.BEL
+    assert passes == [['TCL']]
+    assert set(parallel._chunk_reports[0]) == {
+        'Liability_on_Initial_Recognition', 'BEL', 'RA', 'CSM', 'TCL'
+    }
+
+    parallel.reports()
+    assert passes == [['TCL'], ['AMC', 'ARC']]
+    parallel.ARC
+    assert len(passes) == 2
+
+
+def test_workers_time_their_chunks(sample, parameters):
+    serial = GMMEngine(sample, parameters(), profile_memory=True)
+    serial.reports()
+    assert 'Chunk' not in serial.Timings.columns
+
+    model = GMMEngine(sample, parameters(), workers=2, profile_memory=True)
+    model.reports()
+    timings = model.Timings
+    chunks = timings.dropna(subset=['Chunk'])
+    assert set(chunks['Chunk']) == set(range(len(model._chunks)))
+    assert set(chunks['Stage']) == set(serial.Timings['Stage'])
+    assert chunks['Peak'].notna().all()
+    assert set(model.Frame_Sizes['Chunk'].dropna()) == set(chunks['Chunk'])
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from IFRS17.engine import GMMEngine
+
+MOVEMENTS = [
+    "Changes Related to Future Service: New Business",
+    "Changes Related to Future Service: Assumptions",
+    "Insurance Service Expense",
+    "Changes Related to Current Service: Experience",
+    "Changes Related to Current Service: Release",
+    "Changes Related to Past Service"
+]
+
+
+@pytest.mark.parametrize('frequency, first, periods', [('Quarterly', 'Q1', 4),
+                                                       ('Monthly', '-01', 12)])
+@pytest.mark.parametrize('mode', ['Calculation', 'Input'])
+def test_sub_annual_run_adds_up_to_yearly(sample, parameters, frequency, first,
+                                          periods, mode):
+    # Every movement of a year falls in its first period
+    assumptions = sample.assign(Period=sample['Cohort'].astype(str) + first)
+    yearly = GMMEngine(sample, parameters(mode))
+    engine = GMMEngine(assumptions,
+                       parameters(mode, Reporting_Frequency=frequency))
+    assert len(engine.cube.periods) == 4 * periods
+
+    for report in ['BEL', 'RA', 'CSM', 'TCL']:
+        sub_annual, expected = getattr(engine, report), getattr(yearly, report)
+        assert len(sub_annual.index) == periods * len(expected.index)
+        years = sub_annual.groupby(
+            ['Product', 'Sub-Product', sub_annual.index.year], sort=True)
+        np.testing.assert_allclose(years[MOVEMENTS].sum().to_numpy(),
+                                   expected[MOVEMENTS].to_numpy(),
+                                   err_msg=report)
+        np.testing.assert_allclose(years['Closing Balance'].last().to_numpy(),
+                                   expected['Closing Balance'].to_numpy(),
+                                   err_msg=report)
+
+
+def test_unknown_frequency(sample, parameters):
+    with pytest.raises(ValueError):
+        GMMEngine(sample, parameters(Reporting_Frequency='Weekly'))
@@ -0,0 +1,51 @@
+import pandas as pd
+import pytest
+
+from IFRS17.engine import GMMEngine
+from IFRS17.scenarios import ScenarioEngine
+from IFRS17.sinks import REPORT_NAMES
+
+
+def scenario(engine, name, report):
+    # Rows of one scenario, laid out as the report of a single run
+    frame = getattr(engine, report)
+    frame = frame[frame['Scenario'] == name].drop(columns='Scenario')
+    if report in ('AMC', 'ARC'):
+        frame = frame.reset_index(drop=True)
+    return frame
+
+
+@pytest.fixture(scope='module')
+def stressed(sample):
+    stressed = sample.copy()
+    stressed['Gross_BE'] *= 1.2
+    return stressed
+
+
+def test_scenarios_match_single_runs(sample, stressed, parameters):
+    engine = ScenarioEngine({'base': sample, 'up': stressed}, parameters())
+    for name, assumptions in [('base', sample), ('up', stressed)]:
+        single = GMMEngine(assumptions, parameters())
+        for report in REPORT_NAMES:
+            pd.testing.assert_frame_equal(scenario(engine, name, report),
+                                          getattr(single, report),
+                                          obj=report)
+
+
+def test_scenarios_as_deltas(sample, parameters):
+    delta = sample[sample['Key'] == 'MAP009'].copy()
+    delta['Gross_BE'] = 1000000.0
+    engine = ScenarioEngine({'MAP009': delta}, parameters(), base=sample)
+
+    full = GMMEngine(pd.concat([sample, delta]), parameters())
+    assert not full.BEL.equals(GMMEngine(sample, parameters()).BEL)
+    for report in REPORT_NAMES:
+        pd.testing.assert_frame_equal(scenario(engine, 'MAP009', report),
+                                      getattr(full, report),
+                                      obj=report)
+
+
+def test_scenarios_have_no_update(sample, parameters):
+    engine = ScenarioEngine({'base': sample}, parameters())
+    with pytest.raises(TypeError):
+        engine.update(sample)
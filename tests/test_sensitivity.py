@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from IFRS17.engine import GMMEngine
+from IFRS17.sensitivity import SensitivityEngine
+
+
+def shocked(assumptions, shocks):
+    # The assumptions with every shocked cell scaled
+    assumptions = assumptions.copy()
+    for (key, measure), factor in shocks.items():
+        rows = assumptions['Key'] == key
+        assumptions.loc[rows, measure] *= factor
+    return assumptions
+
+
+SHOCKS = [
+    {
+        ('MAP013', 'Gross_BECFPV'): 1.1
+    },
+    {
+        ('MAP006', 'Gross_CSM'): 1.5,
+        ('MAP009', 'Gross_BE'): 0.8
+    },
+    {
+        ('MAP003', 'Gross_BECFPV'): 0.5
+    },
+]
+
+
+@pytest.mark.parametrize('mode', ['Calculation', 'Input'])
+@pytest.mark.parametrize('shocks', SHOCKS)
+def test_sensitivity_matches_full_run(sample, parameters, mode, shocks):
+    base = GMMEngine(sample, parameters(mode))
+    engine = SensitivityEngine(base, shocks)
+    full = GMMEngine(shocked(sample, shocks), parameters(mode))
+    for report in [
+            'Liability_on_Initial_Recognition', 'BEL', 'RA', 'CSM', 'TCL',
+            'AMC', 'ARC'
+    ]:
+        pd.testing.assert_frame_equal(getattr(engine, report),
+                                      getattr(full, report),
+                                      obj=report)
+
+
+@pytest.mark.parametrize('shocks', SHOCKS)
+def test_sensitivity_releases_by_coverage_units(sample, parameters, shocks):
+    base = GMMEngine(sample, parameters(Coverage_units='Derived'))
+    engine = SensitivityEngine(base, shocks)
+    full = GMMEngine(shocked(sample, shocks),
+                     parameters(Coverage_units='Derived'))
+    for report in ['CSM', 'TCL', 'AMC', 'ARC']:
+        pd.testing.assert_frame_equal(getattr(engine, report),
+                                      getattr(full, report),
+                                      obj=report)
+
+
+def test_impact_is_the_change_against_the_base(sample, parameters):
+    base = GMMEngine(sample, parameters())
+    engine = SensitivityEngine(base, SHOCKS[1])
+    impact = engine.impact('CSM')
+    np.testing.assert_allclose(
+        impact['Closing Balance'].to_numpy(),
+        engine.CSM['Closing Balance'].to_numpy() -
+        base.CSM['Closing Balance'].to_numpy())
+    assert (impact['Sub-Product'] == base.CSM['Sub-Product']).all()
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from IFRS17.engine import GMMEngine
+from IFRS17.gmm import GMM
+from IFRS17.sinks import REPORT_NAMES
+from IFRS17.store import ResultStore, write_store
+
+
+@pytest.fixture(scope='module')
+def engine(sample, parameters):
+    return GMMEngine(sample, parameters())
+
+
+@pytest.fixture
+def store(engine, tmp_path):
+    path = str(tmp_path / 'results.ifrs17')
+    write_store(path, {name: getattr(engine, name) for name in REPORT_NAMES})
+    return ResultStore(path)
+
+
+def test_store_matches_reports(engine, store):
+    for name in REPORT_NAMES:
+        pd.testing.assert_frame_equal(store.frame(name),
+                                      getattr(engine, name),
+                                      obj=name)
+    assert store['AMC'].shape[:2] == (2, 4)
+
+
+def test_store_selects_groups(engine, store):
+    for name in REPORT_NAMES:
+        report = getattr(engine, name)
+        expected = report[report['Sub-Product'] == 'XYZ']
+        if isinstance(report.index, pd.RangeIndex):
+            # AMC and ARC rows are numbered afresh for the selection
+            expected = expected.reset_index(drop=True)
+        pd.testing.assert_frame_equal(store.frame(name, [('NPA', 'XYZ')]),
+                                      expected,
+                                      obj=name)
+
+
+def test_missing_groups_raise(store):
+    with pytest.raises(KeyError):
+        store.frame('BEL', [('NPA', 'MISSING')])
+
+
+def test_store_of_gmm_reports(sample, parameters, engine, tmp_path):
+    gmm = GMM(sample, parameters())
+    path = str(tmp_path / 'gmm.ifrs17')
+    write_store(path, {name: getattr(gmm, name) for name in ['BEL', 'ARC']})
+    store = ResultStore(path)
+    for name in ['BEL', 'ARC']:
+        got, expected = store.frame(name), getattr(engine, name)
+        pd.testing.assert_frame_equal(got, expected, obj=name)